@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: extração serial x paralela (extract_game_file com workers=N)
+
+Gera um container sintético com milhares de blocos zstd e mede o tempo
+de extração para diferentes quantidades de workers.
+
+Uso:
+    python benchmarks/bench_extract_workers.py --blocks 4000 --block-size 32768
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from wwm_tradutor_ptbr import extract_game_file, pack_game_file, DEFAULT_WORKERS
+
+
+def make_synthetic_dats(dat_dir: str, blocks: int, block_size: int):
+    """Cria blocos .dat sintéticos com texto compressível"""
+    rnd = random.Random(42)
+    words = [bytes(rnd.choice(b'abcdefghijklmnopqrstuvwxyz') for _ in range(rnd.randint(2, 10)))
+             for _ in range(2000)]
+    for i in range(blocks):
+        parts = []
+        size = 0
+        while size < block_size:
+            word = rnd.choice(words)
+            parts.append(word)
+            size += len(word) + 1
+        with open(os.path.join(dat_dir, f"synthetic_{i}.dat"), 'wb') as f:
+            f.write(b' '.join(parts)[:block_size])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de extract_game_file com workers")
+    parser.add_argument('--blocks', type=int, default=4000, help='Quantidade de blocos')
+    parser.add_argument('--block-size', type=int, default=32768, help='Tamanho de cada bloco (bytes)')
+    parser.add_argument('--workers', type=int, nargs='+', default=None, help='Valores de workers a medir')
+    args = parser.parse_args()
+
+    workers_list = args.workers or sorted({1, 2, 4, DEFAULT_WORKERS})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src_dir = os.path.join(tmp, 'src')
+        os.makedirs(src_dir)
+        container = os.path.join(tmp, 'synthetic.bin')
+
+        print(f"🔧 Gerando {args.blocks} blocos de {args.block_size} bytes...")
+        make_synthetic_dats(src_dir, args.blocks, args.block_size)
+        pack_game_file(src_dir, container)
+        print(f"📦 Container: {os.path.getsize(container):,} bytes")
+
+        baseline = None
+        for workers in workers_list:
+            out_dir = os.path.join(tmp, f'out_{workers}')
+            os.makedirs(out_dir)
+
+            start = time.perf_counter()
+            extract_game_file(container, out_dir, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            if baseline is None:
+                baseline = elapsed
+            print(f"workers={workers:<3} {elapsed:8.3f}s  speedup {baseline / elapsed:5.2f}x")
+            shutil.rmtree(out_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memória do merge de traduções (wwm_merge_tsv)
+
+Compara o merge em memória (load_tsv_simple + merge_translations +
+save_untranslated_list + save_report) com o merge em streaming
+(merge_tsv_streaming), gerando as mesmas saídas em ambos os casos.
+
+Cada variante roda em um processo próprio; o resultado mostra o pico de
+alocações Python (tracemalloc) e o pico de RSS do processo, quando o módulo
+resource está disponível (Linux/macOS).
+
+Uso:
+    python benchmarks/bench_merge_memory.py --strings 500000
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from wwm_merge_tsv import (
+    load_tsv_simple, merge_translations, save_merged_tsv, save_untranslated_list,
+    save_report, merge_tsv_streaming
+)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+VARIANTS = {
+    'memory': "antes  (OrderedDicts)",
+    'stream': "depois (streaming)",
+}
+
+
+def make_files(tmp: str, strings: int) -> tuple:
+    """Gera uma tradução antiga e um original novo com ~10% de strings novas/removidas"""
+    rnd = random.Random(42)
+    ids = [rnd.getrandbits(64).to_bytes(8, 'little').hex() for _ in range(strings)]
+    old_file = os.path.join(tmp, 'old.tsv')
+    new_file = os.path.join(tmp, 'new.tsv')
+
+    with open(old_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter='\t')
+        writer.writerow(['ID', 'OriginalText'])
+        for text_id in ids[:strings * 9 // 10]:
+            writer.writerow([text_id, f"Texto traduzido {text_id} " * rnd.randint(1, 3)])
+
+    with open(new_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter='\t')
+        writer.writerow(['ID', 'OriginalText'])
+        for text_id in ids[strings // 10:]:
+            writer.writerow([text_id, f"Original text {text_id} " * rnd.randint(1, 3)])
+
+    return old_file, new_file
+
+
+def run_variant(variant: str, old_file: str, new_file: str, output_file: str):
+    """Executado no processo filho: faz o merge e imprime as medidas em JSON"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    if variant == 'memory':
+        old_data = load_tsv_simple(old_file)
+        new_data = load_tsv_simple(new_file)
+        merged, stats = merge_translations(old_data, new_data)
+        save_merged_tsv(merged, output_file)
+        save_untranslated_list(old_data, new_data, output_file)
+        save_report(stats, old_data, new_data, output_file)
+    else:
+        stats = merge_tsv_streaming(old_file, new_file, output_file)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    max_rss = None
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        max_rss *= 1 if sys.platform == 'darwin' else 1024  # Linux informa em KB
+    print(json.dumps({'time': elapsed, 'peak': peak, 'rss': max_rss, 'preserved': stats['preserved']}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memória do merge de traduções")
+    parser.add_argument('--strings', type=int, default=500000, help='Quantidade de strings')
+    parser.add_argument('--variant', choices=sorted(VARIANTS), help=argparse.SUPPRESS)
+    parser.add_argument('--old', help=argparse.SUPPRESS)
+    parser.add_argument('--new', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.variant, args.old, args.new, args.output)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_file, new_file = make_files(tmp, args.strings)
+        print(f"🔧 Arquivos sintéticos: {args.strings:,} strings "
+              f"(antigo {os.path.getsize(old_file):,} bytes, novo {os.path.getsize(new_file):,} bytes)")
+
+        results = {}
+        for variant in VARIANTS:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--variant', variant,
+                 '--old', old_file, '--new', new_file,
+                 '--output', os.path.join(tmp, f'merged_{variant}.tsv')],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results[variant] = json.loads(output.strip().splitlines()[-1])
+
+        with open(os.path.join(tmp, 'merged_memory.tsv'), 'rb') as a, \
+             open(os.path.join(tmp, 'merged_stream.tsv'), 'rb') as b:
+            print(f"🔍 Saídas idênticas: {'sim' if a.read() == b.read() else 'NÃO'}")
+
+        base = results['memory']
+        for variant, label in VARIANTS.items():
+            stats = results[variant]
+            line = f"{label:<22}: {stats['time']:6.3f}s  pico Python {stats['peak'] / 2**20:7.1f} MB"
+            if stats['rss'] is not None:
+                line += f"  RSS máx. {stats['rss'] / 2**20:7.1f} MB"
+            if variant != 'memory':
+                line += f"  ({base['peak'] / stats['peak']:4.1f}x menos alocação)"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
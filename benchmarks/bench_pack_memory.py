@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memória do mapeamento carregado em pack_texts_to_dat
+
+Compara o carregamento antigo do .map (um dict por linha, agrupado em dicts
+por arquivo) com as entradas em colunas (MapEntries via read_tsv_map) e com
+o mapeamento binário (.bmap). Em todos os casos o texto de cada ID é
+resolvido no dicionário de traduções, como no empacotamento.
+
+Cada variante roda em um processo próprio; o resultado mostra o pico de
+alocações Python (tracemalloc) e o pico de RSS do processo, quando o módulo
+resource está disponível (Linux/macOS).
+
+Uso:
+    python benchmarks/bench_pack_memory.py --entries 300000
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from wwm_container import BinaryMap, convert_map_to_binary, read_tsv_map
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+VARIANTS = {
+    'dict': "antes  (dict por linha)",
+    'tsv': "depois (colunas, .map)",
+    'bmap': "depois (colunas, .bmap)",
+}
+
+
+def make_session(tmp: str, entries: int, per_file: int) -> tuple:
+    """Gera um .tsv e um .map sintéticos com o formato da extração"""
+    rnd = random.Random(42)
+    tsv_file = os.path.join(tmp, 'synthetic.tsv')
+    map_file = os.path.join(tmp, 'synthetic.map')
+
+    with open(tsv_file, 'w', newline='', encoding='utf-8') as tsv_f, \
+         open(map_file, 'w', newline='', encoding='utf-8') as map_f:
+        writer = csv.writer(tsv_f, delimiter='\t')
+        map_writer = csv.writer(map_f, delimiter='\t')
+        writer.writerow(['ID', 'OriginalText'])
+        map_writer.writerow(['File', 'AllBlocks', 'WorkBlocks', 'Block', 'Unknown', 'ID'])
+
+        for start in range(0, entries, per_file):
+            count = min(per_file, entries - start)
+            filename = f"synthetic_{start // per_file}.dat"
+            for block in range(count):
+                text_id = rnd.getrandbits(64).to_bytes(8, 'little').hex()
+                writer.writerow([text_id, f"Texto traduzido {start + block} " * rnd.randint(1, 3)])
+                map_writer.writerow([filename, count, count, block, f"{rnd.randint(0, 255):02x}", text_id])
+
+    return tsv_file, map_file
+
+
+def load_translations(tsv_file: str) -> dict:
+    translations = {}
+    with open(tsv_file, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader, None)
+        for row in reader:
+            if len(row) >= 2:
+                translations[row[0]] = row[1]
+    return translations
+
+
+def load_dict(map_file: str, translations: dict) -> list:
+    """Carregamento antigo de pack_texts_to_dat"""
+    file_data = {}
+    with open(map_file, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader, None)
+        for row in reader:
+            if len(row) >= 6:
+                filename = row[0]
+                if filename not in file_data:
+                    file_data[filename] = {
+                        'all_blocks': int(row[1]),
+                        'work_blocks': int(row[2]),
+                        'entries': []
+                    }
+                file_data[filename]['entries'].append({
+                    'block': int(row[3]),
+                    'unknown': row[4],
+                    'id': row[5],
+                    'text': translations.get(row[5], '')
+                })
+    return [file_data]
+
+
+def resolve_texts(files, translations: dict) -> list:
+    """Textos de cada arquivo em colunas (mesma montagem das tarefas do empacotamento)"""
+    tasks = []
+    for entries in files:
+        ids_hex = bytes(entries.ids).hex()
+        texts = [translations.get(ids_hex[i*16:(i+1)*16], '') for i in range(len(entries.blocks))]
+        tasks.append((entries.filename, bytes(entries.unknown_codes), bytes(entries.ids), texts))
+    return tasks
+
+
+def run_variant(variant: str, tsv_file: str, map_file: str):
+    """Executado no processo filho: carrega o mapeamento e imprime as medidas em JSON"""
+    translations = load_translations(tsv_file)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    if variant == 'dict':
+        result = load_dict(map_file, translations)
+    elif variant == 'tsv':
+        result = resolve_texts(read_tsv_map(map_file), translations)
+    else:
+        with BinaryMap(map_file.replace('.map', '.bmap')) as bmap:
+            result = resolve_texts(bmap, translations)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    max_rss = None
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        max_rss *= 1 if sys.platform == 'darwin' else 1024  # Linux informa em KB
+    print(json.dumps({'time': elapsed, 'peak': peak, 'rss': max_rss, 'files': len(result)}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memória do mapeamento no empacotamento")
+    parser.add_argument('--entries', type=int, default=300000, help='Quantidade de entradas no .map')
+    parser.add_argument('--per-file', type=int, default=500, help='Entradas por .dat')
+    parser.add_argument('--variant', choices=sorted(VARIANTS), help=argparse.SUPPRESS)
+    parser.add_argument('--tsv', help=argparse.SUPPRESS)
+    parser.add_argument('--map', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.variant, args.tsv, args.map)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv_file, map_file = make_session(tmp, args.entries, args.per_file)
+        convert_map_to_binary(map_file)
+        print(f"🔧 Mapeamento sintético: {args.entries:,} entradas "
+              f"(.map {os.path.getsize(map_file):,} bytes, "
+              f".bmap {os.path.getsize(map_file.replace('.map', '.bmap')):,} bytes)")
+
+        results = {}
+        for variant in VARIANTS:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--variant', variant,
+                 '--tsv', tsv_file, '--map', map_file],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results[variant] = json.loads(output.strip().splitlines()[-1])
+
+        base = results['dict']
+        for variant, label in VARIANTS.items():
+            stats = results[variant]
+            line = f"{label:<24}: {stats['time']:6.3f}s  pico Python {stats['peak'] / 2**20:7.1f} MB"
+            if stats['rss'] is not None:
+                line += f"  RSS máx. {stats['rss'] / 2**20:7.1f} MB"
+            if variant != 'dict':
+                line += f"  ({base['peak'] / stats['peak']:4.1f}x menos alocação)"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
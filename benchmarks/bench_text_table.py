@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: leitura da tabela de entradas de um bloco de texto
+
+Compara a leitura antiga (seek + read(8) + dois struct.unpack por entrada,
+direto no arquivo) com parse_text_block (arquivo lido uma vez, tabela
+decodificada com struct.iter_unpack e textos fatiados de uma memoryview).
+
+Uso:
+    python benchmarks/bench_text_table.py --entries 100000
+"""
+
+import os
+import sys
+import time
+import random
+import struct
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from wwm_container import TEXT_BLOCK_SIGNATURE, parse_text_block
+
+
+def make_text_block(entries: int) -> bytes:
+    """Monta um bloco de texto sintético no formato do jogo"""
+    rnd = random.Random(42)
+    texts = [f"Texto de exemplo {i} ".encode('utf-8') * rnd.randint(1, 4) for i in range(entries)]
+    unknown = bytes(rnd.randint(0, 255) for _ in range(entries))
+
+    header = struct.pack('<IIII', entries, 0, entries, 0) + TEXT_BLOCK_SIGNATURE + b'\x00' * 4
+    padding = b'\xFF' + unknown[:16]
+    start_id = len(header) + entries + 17
+    curr_text = start_id + entries * 16
+
+    table = []
+    for i, text in enumerate(texts):
+        offset = curr_text - (start_id + i * 16 + 8)
+        table.append(rnd.getrandbits(64).to_bytes(8, 'little') + struct.pack('<II', offset, len(text)))
+        curr_text += len(text)
+
+    return header + unknown + padding + b''.join(table) + b''.join(texts)
+
+
+def read_entries_legacy(path: str) -> list:
+    """Leitura antiga de extract_texts_to_tsv (uma entrada por vez no arquivo)"""
+    rows = []
+    with open(path, 'rb') as f:
+        count_full = struct.unpack('<I', f.read(4))[0]
+        f.read(4)
+        struct.unpack('<I', f.read(4))
+        f.read(12)
+        f.read(count_full)
+        f.read(17)
+        data_start = f.tell()
+
+        for i in range(count_full):
+            f.seek(data_start + (i * 16))
+            text_id = f.read(8).hex()
+            start_text_offset = f.tell()
+            offset_text = struct.unpack('<I', f.read(4))[0]
+            length = struct.unpack('<I', f.read(4))[0]
+
+            f.seek(start_text_offset + offset_text)
+            text = f.read(length).decode('utf-8', errors='ignore')
+            rows.append((text_id, text))
+    return rows
+
+
+def read_entries_bulk(path: str) -> list:
+    """Leitura atual: arquivo inteiro + parse_text_block"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    _, _, _, entries = parse_text_block(data)
+    return [(text_id.hex(), text.decode('utf-8', errors='ignore')) for text_id, text in entries]
+
+
+def best_of(func, path: str, rounds: int) -> tuple:
+    best = float('inf')
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func(path)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da leitura da tabela de textos")
+    parser.add_argument('--entries', type=int, default=100000, help='Quantidade de entradas no bloco')
+    parser.add_argument('--rounds', type=int, default=3, help='Repetições (vale o melhor tempo)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'synthetic_0.dat')
+        with open(path, 'wb') as f:
+            f.write(make_text_block(args.entries))
+        print(f"🔧 Bloco sintético: {args.entries:,} entradas, {os.path.getsize(path):,} bytes")
+
+        legacy_time, legacy_rows = best_of(read_entries_legacy, path, args.rounds)
+        bulk_time, bulk_rows = best_of(read_entries_bulk, path, args.rounds)
+
+        if legacy_rows != bulk_rows:
+            print("❌ Resultados diferentes entre as duas leituras!")
+            sys.exit(1)
+
+        print(f"antes  (seek/read por entrada): {legacy_time:8.3f}s")
+        print(f"depois (iter_unpack em bloco):  {bulk_time:8.3f}s  speedup {legacy_time / bulk_time:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
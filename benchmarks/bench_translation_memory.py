@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memória de tradução (wwm_memoria)
+
+Monta a memória com textos sintéticos (vocabulário com distribuição de
+Zipf, como um texto real: poucas palavras muito comuns e muitas raras) e
+mede o tempo por busca de strings "novas": metade são variações de textos
+já traduzidos (uma a três palavras trocadas, inseridas ou removidas) e
+metade são textos sem parentes na memória.
+
+Qualidade: nas variações, a melhor sugestão tem de ser pelo menos tão
+parecida quanto o texto de onde a variação saiu (quando ele passa da
+similaridade mínima); conta-se a % de buscas em que isso acontece.
+
+Uso:
+    python benchmarks/bench_translation_memory.py --strings 300000 --queries 2000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from wwm_memoria import TranslationMemory, DEFAULT_MIN_SCORE
+
+# Sílabas e palavras curtas comuns com cara de inglês (e de nomes em pinyin)
+ONSETS = ["", "b", "c", "d", "f", "g", "h", "j", "k", "l", "m", "n", "p", "r", "s", "t", "v", "w", "y", "z",
+          "th", "sh", "ch", "st", "tr", "br", "cr", "pl", "gr", "fl", "qu", "wh", "sp", "x"]
+NUCLEI = ["a", "e", "i", "o", "u", "ai", "ea", "ou", "ie", "oo", "ao", "ia", "ue", "y"]
+CODAS = ["", "", "", "n", "r", "s", "t", "l", "nd", "st", "ng", "ck", "m", "rd", "nt", "sh", "x"]
+COMMON = ["the", "of", "to", "and", "a", "in", "you", "your", "is", "with", "for", "this", "on",
+          "be", "can", "will", "from", "at", "by", "not", "it", "my", "has", "have", "all"]
+MARKUP = ["{0}", "#Gouro#E", "<Tecla|1|2|3>", "{{NOME}}", "#G", "#E"]
+
+
+def make_vocabulary(rnd: random.Random, size: int) -> tuple:
+    """Palavras (as comuns primeiro), pesos de Zipf e uma "tradução" palavra a palavra"""
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rnd.choice(ONSETS) + rnd.choice(NUCLEI) + rnd.choice(CODAS)
+                          for _ in range(rnd.choice((1, 1, 2, 2, 2, 3, 3, 4)))))
+    words = sorted(words - set(COMMON))
+    rnd.shuffle(words)
+    words = COMMON + words[:size - len(COMMON)]
+    weights = [1 / rank for rank in range(1, size + 1)]
+    translation = dict(zip(words, reversed(words)))
+    return words, weights, translation
+
+
+def make_text(rnd: random.Random, words: list, weights: list) -> list:
+    # 30% nomes/itens curtos, 70% frases
+    length = rnd.randint(1, 3) if rnd.random() < 0.3 else rnd.randint(4, 24)
+    text = rnd.choices(words, weights, k=length)
+    if rnd.random() < 0.1:
+        text.insert(rnd.randrange(len(text) + 1), rnd.choice(MARKUP))
+    return text
+
+
+def mutate(rnd: random.Random, text: list, words: list, weights: list) -> list:
+    text = list(text)
+    for _ in range(rnd.randint(1, 3)):
+        operation = rnd.random()
+        if operation < 0.4 and len(text) > 1:
+            text[rnd.randrange(len(text))] = rnd.choices(words, weights)[0]
+        elif operation < 0.7:
+            text.insert(rnd.randrange(len(text) + 1), rnd.choices(words, weights)[0])
+        elif len(text) > 1:
+            del text[rnd.randrange(len(text))]
+    return text
+
+
+def similarity(text: str, other: str) -> float:
+    """Similaridade exata entre dois textos (memória com um texto só)"""
+    memory = TranslationMemory()
+    memory.add(other, "")
+    results = memory.search(text, 1, 0)
+    return results[0][0] if results else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da memória de tradução")
+    parser.add_argument('--strings', type=int, default=300000, help='Textos traduzidos na memória')
+    parser.add_argument('--queries', type=int, default=2000, help='Strings novas buscadas')
+    parser.add_argument('--vocabulary', type=int, default=20000, help='Palavras distintas')
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    words, weights, translation = make_vocabulary(rnd, args.vocabulary)
+    texts = [make_text(rnd, words, weights) for _ in range(args.strings)]
+
+    start = time.perf_counter()
+    memory = TranslationMemory()
+    for text in texts:
+        memory.add(' '.join(text), ' '.join(translation.get(word, word) for word in text))
+    memory.build()
+    build_time = time.perf_counter() - start
+    print(f"🔧 Memória: {len(memory):,} textos distintos de {args.strings:,} "
+          f"(vocabulário {args.vocabulary:,}), montada em {build_time:.2f}s")
+
+    queries = []
+    for number in range(args.queries):
+        if number % 2:
+            queries.append((' '.join(make_text(rnd, words, weights)), None))
+        else:
+            source = rnd.choice(texts)
+            queries.append((' '.join(mutate(rnd, source, words, weights)), ' '.join(source)))
+
+    times = []
+    suggested = 0
+    found = 0
+    expected = 0
+    for query, source in queries:
+        start = time.perf_counter()
+        results = memory.search(query)
+        times.append(time.perf_counter() - start)
+        suggested += bool(results)
+
+        if source is not None:
+            score = similarity(query, source)
+            if score >= DEFAULT_MIN_SCORE:
+                expected += 1
+                found += bool(results) and results[0][0] >= score
+    times.sort()
+    mean = sum(times) / len(times)
+    print(f"🔍 {len(queries):,} buscas (k=3): média {mean * 1000:.2f} ms  "
+          f"p50 {times[len(times) // 2] * 1000:.2f} ms  p99 {times[len(times) * 99 // 100] * 1000:.2f} ms  "
+          f"máx. {times[-1] * 1000:.2f} ms  com sugestão: {suggested:,}")
+    print(f"✅ Variações com sugestão tão parecida quanto o texto de origem: {found / expected:.1%} "
+          f"de {expected:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: leitura de um pt-br.tsv com wwm_tsv x csv.reader
+
+Compara, no mesmo arquivo sintético, a leitura antiga das ferramentas
+(csv.reader linha a linha) com o leitor em bytes do wwm_tsv, conferindo que
+o resultado é idêntico. Todas as leituras interpretam o TSV (sem snapshot):
+    - colunas (memória de tradução): csv.reader x load_tsv_columns
+    - OrderedDict com IDs sem espaços (merge): csv.reader x load_tsv_simple
+    - dict {id: texto} (tradutor): csv.reader x load_tsv
+
+O arquivo é gerado em dois formatos: como o repositório de tradução grava
+(\\n, aspas soltas dentro dos textos) e como o csv.writer grava (\\r\\n,
+campos com aspas entre aspas); ~4% das linhas têm aspas. Cada medida é o
+melhor de --repeat execuções.
+
+Uso:
+    python benchmarks/bench_tsv_loader.py --lines 500000
+"""
+
+import os
+import sys
+import csv
+import time
+import random
+import argparse
+import tempfile
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from wwm_tsv import load_tsv_columns, load_tsv
+from wwm_merge_tsv import load_tsv_simple
+
+WORDS = ["Você", "encontrou", "a", "espada", "do", "mestre", "#Gouro#E", "{0}", "missão",
+         "<Tecla|1|2|3>", "não", "pode", "aceitar", "agora", "ç"]
+
+
+def make_file(tmp: str, lines: int, style: str) -> str:
+    """Gera um pt-br.tsv sintético; style: 'repo' (\\n, texto cru) ou 'csv' (csv.writer)"""
+    rnd = random.Random(42)
+    path = os.path.join(tmp, f'pt-br_{style}.tsv')
+    rows = []
+    for i in range(lines):
+        words = [rnd.choice(WORDS) for _ in range(rnd.randint(3, 14))]
+        # ~3% das linhas com um nome entre aspas e ~1% com o texto todo entre aspas
+        if rnd.random() < 0.03:
+            words[rnd.randrange(len(words))] = '"Lâmina"'
+        text = ' '.join(words)
+        if rnd.random() < 0.01:
+            text = f'"{text}"'
+        rows.append((rnd.getrandbits(64).to_bytes(8, 'little').hex(), text))
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        if style == 'csv':
+            writer = csv.writer(f, delimiter='\t')
+            writer.writerow(['ID', 'OriginalText'])
+            writer.writerows(rows)
+        else:
+            f.write('ID\tOriginalText\n')
+            f.writelines(f"{text_id}\t{text}\n" for text_id, text in rows)
+    return path
+
+
+def csv_columns(path: str) -> tuple:
+    """Leitura antiga em colunas (memória de tradução)"""
+    ids, texts = [], []
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader, None)
+        for row in reader:
+            if row:
+                ids.append(row[0])
+                texts.append(row[1] if len(row) > 1 else None)
+    return ids, texts
+
+
+def tsv_columns(path: str) -> tuple:
+    return load_tsv_columns(path, cache=False)
+
+
+def csv_ordered(path: str) -> OrderedDict:
+    """Leitura antiga do merge (load_tsv_simple)"""
+    data = OrderedDict()
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader, None)
+        for row in reader:
+            if len(row) >= 2:
+                data[row[0].strip()] = row[1]
+            elif len(row) == 1:
+                data[row[0].strip()] = ""
+    return data
+
+
+def merge_ordered(path: str) -> OrderedDict:
+    return load_tsv_simple(path, cache=False)
+
+
+def csv_dict(path: str) -> dict:
+    """Leitura antiga do tradutor (load_tsv)"""
+    data = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader, None)
+        for row in reader:
+            if len(row) >= 2:
+                data[row[0]] = row[1]
+    return data
+
+
+CASES = [
+    ("colunas (memória)", csv_columns, tsv_columns),
+    ("OrderedDict (merge)", csv_ordered, merge_ordered),
+    ("dict (tradutor)", csv_dict, load_tsv),
+]
+
+
+def best_time(func, path: str, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do leitor de TSV compartilhado")
+    parser.add_argument('--lines', type=int, default=500000, help='Quantidade de linhas')
+    parser.add_argument('--repeat', type=int, default=5, help='Execuções por medida')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for style, label in (('repo', "formato do repositório (\\n)"), ('csv', "formato do csv.writer (\\r\\n)")):
+            path = make_file(tmp, args.lines, style)
+            print(f"🔧 {label}: {args.lines:,} linhas ({os.path.getsize(path):,} bytes)")
+
+            for name, old, new in CASES:
+                same = old(path) == new(path)
+                old_time = best_time(old, path, args.repeat)
+                new_time = best_time(new, path, args.repeat)
+                print(f"   {name:<22}: antes {old_time:6.3f}s  depois {new_time:6.3f}s  "
+                      f"({old_time / new_time:4.2f}x)  "
+                      f"idêntico: {'sim' if same else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: dicionário zstd treinado x pyzstd.compress padrão
+
+Treina um dicionário com os blocos de texto de uma sessão extraída, salva o
+dicionário na própria sessão (text_blocks.zdict) e mostra quanto ele ganharia
+em taxa de compactação e velocidade de descompactação.
+
+Uso:
+    python benchmarks/bench_zstd_dictionary.py --session output/17102026120000
+    python benchmarks/bench_zstd_dictionary.py --session output/17102026120000 --retrain --level 9
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from wwm_container import (
+    DICT_FILE_NAME, DEFAULT_DICT_SIZE, train_text_dictionary, benchmark_text_dictionary
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de dicionário zstd para blocos de texto")
+    parser.add_argument('--session', required=True, help='Pasta da sessão (contém dat/)')
+    parser.add_argument('--dict-size', type=int, default=DEFAULT_DICT_SIZE, help='Tamanho do dicionário')
+    parser.add_argument('--level', type=int, default=3, help='Nível de compactação zstd')
+    parser.add_argument('--retrain', action='store_true', help='Treina de novo mesmo se já existir')
+    args = parser.parse_args()
+
+    dat_dir = os.path.join(args.session, 'dat')
+    dict_file = os.path.join(args.session, DICT_FILE_NAME)
+
+    if not os.path.isdir(dat_dir):
+        print(f"❌ Pasta dat não encontrada: {dat_dir}")
+        sys.exit(1)
+
+    if args.retrain or not os.path.exists(dict_file):
+        if not train_text_dictionary(dat_dir, dict_file, args.dict_size, log_callback=print):
+            sys.exit(1)
+
+    if not benchmark_text_dictionary(dat_dir, dict_file, level=args.level, log_callback=print):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 
 a = Analysis(
     ['wwm_ptbr_launcher.py'],
-    pathex=[],
+    pathex=['../tools'],
     binaries=[],
     datas=[],
     hiddenimports=[],
@@ -25,9 +25,11 @@ echo [2/3] Compilando...
 pyinstaller --noconfirm --onefile --windowed ^
     --name "WWM_Tradutor_PTBR" ^
     --icon "icon.ico" ^
+    --paths "..\tools" ^
     wwm_ptbr_launcher.py 2>nul || (
         pyinstaller --noconfirm --onefile --windowed ^
             --name "WWM_Tradutor_PTBR" ^
+            --paths "..\tools" ^
             wwm_ptbr_launcher.py
     )
 
@@ -22,6 +22,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Estrutura dos arquivos de tradução, compartilhada com o tradutor (tools/wwm_layout.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+from wwm_layout import TRANSLATION_STRUCTURE, TRANSLATION_FILES
+
 # Configuração de DPI para Windows ANTES de importar Qt
 if sys.platform == 'win32':
     try:
@@ -111,22 +115,6 @@ LOCAL_CONFIG_FILE = "wwm_ptbr_launcher.json"
 # Arquivo de configuração da tradução (na pasta de tradução do jogo)
 TRANSLATION_CONFIG_FILE = ".wwm_ptbr_config"
 
-# Arquivos de tradução - estrutura de pastas relativas ao HD
-# Cada pasta contém os mesmos arquivos, mas com conteúdo diferente
-TRANSLATION_STRUCTURE = {
-    "oversea/locale": [
-        "translate_words_map_en",
-        "translate_words_map_en_diff"
-    ],
-    "locale": [
-        "translate_words_map_en",
-        "translate_words_map_en_diff"
-    ]
-}
-
-# Lista plana de nomes de arquivos (para compatibilidade)
-TRANSLATION_FILES = ["translate_words_map_en", "translate_words_map_en_diff"]
-
 # Plataformas suportadas
 class Platform:
     STEAM = "steam"
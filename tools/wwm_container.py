@@ -0,0 +1,1312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWM Container - Leitura dos containers binários do jogo
+Formato compartilhado entre o tradutor (GUI) e ferramentas de linha de comando
+
+Autor: rodrigomiquilino
+Projeto: https://github.com/rodrigomiquilino/wwm_brasileiro
+Licença: MIT
+
+Estrutura do container (.bin):
+    assinatura(4) + versão(4) + quantidade_offsets - 1 (4)
+    Bloco único:    tamanho(4) + bloco
+    Vários blocos:  offsets(4 * N) + blocos
+    Cada bloco:     comp_type(1) + comp_size(4) + decomp_size(4) + dados zstd
+"""
+
+import re
+import os
+import sys
+import csv
+import json
+import mmap
+import bisect
+import time
+import struct
+import hashlib
+import argparse
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyzstd
+except ImportError:
+    print("Erro: pyzstd não encontrado. Instale com: pip install pyzstd")
+    sys.exit(1)
+
+
+# ============================================================================
+# CONFIGURAÇÃO
+# ============================================================================
+
+GAME_FILE_SIGNATURE = b'\xEF\xBE\xAD\xDE'
+TEXT_BLOCK_SIGNATURE = b'\xDC\x96\x58\x59'
+
+BLOCK_HEADER_SIZE = 9  # comp_type(1) + comp_size(4) + decomp_size(4)
+COMP_TYPE_ZSTD = 0x04
+
+BlockInfo = namedtuple('BlockInfo', ['comp_type', 'comp_size', 'decomp_size'])
+
+
+# ============================================================================
+# LEITOR DE CONTAINER
+# ============================================================================
+
+class ContainerReader:
+    """
+    Leitor de container do jogo via mmap (sem cópias intermediárias)
+
+    O arquivo é mapeado em memória e os blocos são entregues ao
+    descompactador como fatias de memoryview. Pode ser usado como
+    context manager:
+
+        with ContainerReader(caminho) as reader:
+            for index, data in reader.iter_blocks():
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = None
+        self._view = None
+        self._offsets = None
+
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size < 16:
+                raise ValueError("assinatura não reconhecida")
+
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+
+            if self._view[:4] != GAME_FILE_SIGNATURE:
+                raise ValueError("assinatura não reconhecida")
+
+            self.offset_count = struct.unpack_from('<I', self._view, 8)[0] + 1
+
+            if self.offset_count == 1:
+                # Arquivo com bloco único: tamanho(4) + bloco
+                block_len = struct.unpack_from('<I', self._view, 12)[0]
+                self.data_start = 16
+                self._single_block_len = block_len
+            else:
+                # Arquivo com múltiplos blocos: tabela de offsets + blocos
+                table_end = 12 + self.offset_count * 4
+                if table_end > file_size:
+                    raise ValueError("tabela de offsets truncada")
+                table = self._view[12:table_end]
+                if sys.byteorder == 'little':
+                    self._offsets = table.cast('I')
+                else:
+                    self._offsets = struct.unpack_from(f'<{self.offset_count}I', table)
+                    table.release()
+                self.data_start = table_end
+
+            self.file_size = file_size
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        """Quantidade de blocos (índices usados nos nomes _{i}.dat)"""
+        if self.offset_count == 1:
+            return 1
+        return self.offset_count - 1
+
+    def close(self):
+        """Libera as views e o mapeamento do arquivo"""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._offsets = None
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def raw_block(self, index: int):
+        """
+        Retorna uma memoryview do bloco compactado (com o header de 9 bytes)
+        ou None se o bloco for vazio/inválido
+        """
+        if self.offset_count == 1:
+            if index != 0:
+                raise IndexError(index)
+            start = self.data_start
+            end = start + self._single_block_len
+        else:
+            if not 0 <= index < self.offset_count - 1:
+                raise IndexError(index)
+            current_offset = self._offsets[index]
+            block_len = self._offsets[index + 1] - current_offset
+
+            # Verifica se block_len é válido (proteção para arquivos _diff)
+            if block_len <= 0:
+                # Tenta calcular o tamanho restante
+                block_len = (self.file_size - self.data_start) - current_offset
+                if block_len <= 0:
+                    return None
+
+            start = self.data_start + current_offset
+            end = start + block_len
+
+        block = self._view[start:end]
+        if len(block) < BLOCK_HEADER_SIZE:
+            block.release()
+            return None
+        return block
+
+    def block_header(self, index: int):
+        """Retorna BlockInfo(comp_type, comp_size, decomp_size) do bloco ou None"""
+        block = self.raw_block(index)
+        if block is None:
+            return None
+        with block:
+            return BlockInfo._make(struct.unpack_from('<BII', block))
+
+    def read_block(self, index: int):
+        """
+        Descompacta o bloco direto da memoryview do arquivo
+        Retorna None para blocos vazios ou de tipo não suportado
+        """
+        block = self.raw_block(index)
+        if block is None:
+            return None
+        with block:
+            if block[0] != COMP_TYPE_ZSTD:
+                return None
+            with block[BLOCK_HEADER_SIZE:] as comp_data:
+                return pyzstd.decompress(comp_data)
+
+    def peek_block(self, index: int, size: int = 20):
+        """
+        Descompacta só os primeiros size bytes do bloco (decompressor em streaming)
+        Usado para testar a assinatura sem descompactar o bloco inteiro
+        Retorna None para blocos vazios ou de tipo não suportado
+        """
+        block = self.raw_block(index)
+        if block is None:
+            return None
+        with block:
+            if block[0] != COMP_TYPE_ZSTD:
+                return None
+            with block[BLOCK_HEADER_SIZE:] as comp_data:
+                return pyzstd.ZstdDecompressor().decompress(comp_data, max_length=size)
+
+    def is_text_block(self, index: int) -> bool:
+        """Verifica a assinatura de texto do bloco sem descompactá-lo inteiro"""
+        try:
+            head = self.peek_block(index, 20)  # assinatura em [16:20]
+        except pyzstd.ZstdError:
+            return False
+        return head is not None and is_text_block(head)
+
+    def iter_blocks(self):
+        """Itera (índice, dados descompactados) pulando blocos inválidos"""
+        for i in range(len(self)):
+            try:
+                data = self.read_block(i)
+            except pyzstd.ZstdError:
+                continue
+            if data is not None:
+                yield i, data
+
+
+class GameContainer(ContainerReader):
+    """
+    Container com acesso aleatório aos blocos
+
+    container[i] descompacta o bloco i sob demanda (None se o bloco for
+    vazio/inválido) e block_header(i) retorna os metadados sem descompactar.
+    Com cache_size > 0, os últimos blocos lidos ficam em um cache LRU.
+
+        with GameContainer(caminho, cache_size=64) as container:
+            for i in range(len(container)):
+                info = container.block_header(i)
+                ...
+    """
+
+    def __init__(self, path: str, cache_size: int = 0):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        super().__init__(path)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        if self.cache_size > 0:
+            with self._cache_lock:
+                if index in self._cache:
+                    self._cache.move_to_end(index)
+                    return self._cache[index]
+
+        data = self.read_block(index)
+
+        if self.cache_size > 0 and data is not None:
+            with self._cache_lock:
+                self._cache[index] = data
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return data
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def cache_clear(self):
+        """Esvazia o cache LRU"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self):
+        self._cache = OrderedDict()
+        super().close()
+
+
+def _block_digest(data) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _compare_block(original: ContainerReader, repacked: ContainerReader, index: int):
+    """
+    Compara o bloco index dos dois containers
+    Retorna (igual, descompactou, motivo)
+    """
+    frame_a = original.raw_block(index) if index < len(original) else None
+    frame_b = repacked.raw_block(index) if index < len(repacked) else None
+    try:
+        if frame_a is None or frame_b is None:
+            same = frame_a is None and frame_b is None
+            return same, False, None if same else "bloco ausente ou vazio"
+
+        # Frames compactados idênticos: nada a descompactar
+        if _block_digest(frame_a) == _block_digest(frame_b):
+            return True, False, None
+
+        info_a = BlockInfo._make(struct.unpack_from('<BII', frame_a))
+        info_b = BlockInfo._make(struct.unpack_from('<BII', frame_b))
+        if info_a.decomp_size != info_b.decomp_size:
+            return False, False, f"tamanho {info_a.decomp_size} ≠ {info_b.decomp_size}"
+        if info_a.comp_type != info_b.comp_type:
+            return False, False, f"compressão {info_a.comp_type} ≠ {info_b.comp_type}"
+    finally:
+        if frame_a is not None:
+            frame_a.release()
+        if frame_b is not None:
+            frame_b.release()
+
+    # Mesmo tamanho, frames diferentes (ex.: outro nível do zstd): compara o conteúdo
+    try:
+        data_a = original.read_block(index)
+        data_b = repacked.read_block(index)
+    except pyzstd.ZstdError as e:
+        return False, True, f"erro ao descompactar: {e}"
+    if data_a is None or data_b is None:
+        return data_a is data_b, True, None if data_a is data_b else "tipo de compressão não suportado"
+    if _block_digest(data_a) != _block_digest(data_b):
+        return False, True, "conteúdo diferente"
+    return True, True, None
+
+
+def compare_containers(original_file: str, repacked_file: str, workers: int = 1,
+                       log_callback=None) -> dict:
+    """
+    Compara um container reempacotado com o original, bloco a bloco
+    Frames compactados iguais são comparados só pelo hash; os demais são
+    descompactados e comparados pelo hash do conteúdo
+
+    Retorna: dict com as estatísticas e a lista 'mismatches' de
+    (índice, motivo), ou vazio em caso de erro
+    """
+    try:
+        with ContainerReader(original_file) as original, ContainerReader(repacked_file) as repacked:
+            count = max(len(original), len(repacked))
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                results = list(pool.map(lambda i: _compare_block(original, repacked, i), range(count)))
+
+        stats = {
+            'blocks': count,
+            'identical_frames': sum(1 for same, decompressed, _ in results if same and not decompressed),
+            'decompressed': sum(1 for _, decompressed, _ in results if decompressed),
+            'mismatches': [(i, reason) for i, (same, _, reason) in enumerate(results) if not same],
+        }
+
+        if log_callback:
+            log_callback(f"🔍 {count} blocos: {stats['identical_frames']} frames idênticos, "
+                         f"{stats['decompressed']} comparados descompactados")
+            for index, reason in stats['mismatches']:
+                log_callback(f"❌ Bloco {index}: {reason}")
+            if stats['mismatches']:
+                log_callback(f"❌ {len(stats['mismatches'])} blocos diferentes do original")
+            else:
+                log_callback("✅ Container idêntico ao original (conteúdo de todos os blocos)")
+        return stats
+
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro na verificação: {str(e)}")
+        return {}
+
+
+# ============================================================================
+# BLOCOS DE TEXTO
+# ============================================================================
+#
+# Estrutura de um bloco de texto descompactado (.dat):
+#     count_full(4) + 0(4) + count_text(4) + 0(4) + assinatura(4) + 0(4)
+#     unknown(count_full) + padding(17)
+#     tabela: ID(8) + offset(4) + tamanho(4) por entrada (offset relativo ao fim do ID)
+#     textos UTF-8
+
+TEXT_HEADER_SIZE = 24
+TEXT_ENTRY_SIZE = 16
+
+
+def is_text_block(data) -> bool:
+    """Verifica a assinatura de bloco de texto (offset 16)"""
+    return data[16:20] == TEXT_BLOCK_SIGNATURE
+
+
+def parse_text_block(data):
+    """
+    Decodifica um bloco de texto descompactado
+
+    Retorna: (count_full, count_text, unknown_codes, entries)
+        unknown_codes: bytes com um código por entrada
+        entries: lista de (id_bytes, text_bytes) na ordem do bloco
+    """
+    count_full, _, count_text = struct.unpack_from('<III', data, 0)
+    unknown_codes = bytes(data[TEXT_HEADER_SIZE:TEXT_HEADER_SIZE + count_full])
+    data_start = TEXT_HEADER_SIZE + count_full + 17
+
+    # Tabela inteira decodificada de uma vez; o offset de cada texto é
+    # relativo ao fim do ID da própria entrada
+    view = memoryview(data)
+    table = view[data_start:data_start + count_full * TEXT_ENTRY_SIZE]
+    entries = []
+    pos = data_start + 8
+    for text_id, offset_text, length in struct.iter_unpack('<8sII', table):
+        start = pos + offset_text
+        entries.append((text_id, bytes(view[start:start + length])))
+        pos += TEXT_ENTRY_SIZE
+
+    table.release()
+    view.release()
+    return count_full, count_text, unknown_codes, entries
+
+
+def build_text_block(all_blocks: int, work_blocks: int, entries) -> list:
+    """
+    Monta um bloco de texto (inverso de parse_text_block)
+
+    entries: sequência de (unknown_byte, id_bytes, text_bytes) na ordem do bloco
+    Retorna: lista de partes do arquivo, para writelines() ou b''.join()
+    """
+    unknown_codes = b''.join(entry[0] for entry in entries)
+    texts = [entry[2] for entry in entries]
+
+    # Header: all_blocks(4) + 0(4) + work_blocks(4) + 0(4) + signature(4) + 0(4)
+    header = struct.pack('<IIII', all_blocks, 0, work_blocks, 0) + TEXT_BLOCK_SIGNATURE + b'\x00' * 4
+
+    # Padding após os unknown bytes (17 bytes extras):
+    # \xFF + primeiros 16 bytes dos unknown_codes (ou completado com \x80)
+    if len(unknown_codes) >= 16:
+        padding = b'\xFF' + unknown_codes[:16]
+    else:
+        padding = b'\xFF' + unknown_codes + b'\x80' * (16 - len(unknown_codes))
+
+    # Offset de cada texto é relativo à posição logo após o ID da entrada
+    start_id = TEXT_HEADER_SIZE + all_blocks + 17
+    curr_text = start_id + all_blocks * TEXT_ENTRY_SIZE
+    values = []
+    for i, (_, text_id, text) in enumerate(entries):
+        values += (text_id, curr_text - (start_id + i * TEXT_ENTRY_SIZE + 8), len(text))
+        curr_text += len(text)
+    table = struct.pack('<' + '8sII' * len(texts), *values)
+
+    return [header, unknown_codes, padding, table] + texts
+
+
+# ============================================================================
+# TEXTO BRUTO (ESCAPE SEM PERDAS)
+# ============================================================================
+#
+# O TSV normal decodifica com errors='ignore' e só escapa \n e \r, então
+# bytes inválidos e barras invertidas do original não voltam iguais.
+# No modo bruto cada texto passa por escape_text/unescape_text, que
+# preservam os bytes originais:
+#     \ → \\    quebra de linha → \n    \r → \r    tab → \t
+#     byte que não é UTF-8 válido → \xHH
+
+RAW_TEXT_EXT = '.raw'  # Marcador ao lado do TSV extraído em modo bruto
+
+_ESCAPES = {'\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t'}
+_UNESCAPES = {'\\': '\\', 'n': '\n', 'r': '\r', 't': '\t'}
+_ESCAPE_RE = re.compile('[\\\\\n\r\t\udc80-\udcff]')
+_UNESCAPE_RE = re.compile(r'\\(x[0-9a-fA-F]{2}|.)', re.DOTALL)
+
+
+def _escape_char(match) -> str:
+    char = match.group()
+    escaped = _ESCAPES.get(char)
+    if escaped is None:
+        # Byte inválido preservado pelo surrogateescape (U+DC80..U+DCFF)
+        escaped = f"\\x{ord(char) - 0xDC00:02x}"
+    return escaped
+
+
+def _unescape_char(match) -> str:
+    code = match.group(1)
+    if len(code) == 3:
+        value = int(code[1:], 16)
+        return chr(value) if value < 0x80 else chr(0xDC00 + value)
+    return _UNESCAPES.get(code, match.group())
+
+
+def escape_text(data) -> str:
+    """Bytes do texto original → texto do TSV (modo bruto, uma passada)"""
+    return _ESCAPE_RE.sub(_escape_char, bytes(data).decode('utf-8', errors='surrogateescape'))
+
+
+def unescape_text(text: str) -> bytes:
+    """Texto do TSV (modo bruto) → bytes originais (inverso de escape_text)"""
+    return _UNESCAPE_RE.sub(_unescape_char, text).encode('utf-8', errors='surrogateescape')
+
+
+def raw_text_marker(tsv_file: str) -> str:
+    """Caminho do marcador de modo bruto de um TSV"""
+    return os.path.splitext(tsv_file)[0] + RAW_TEXT_EXT
+
+
+# ============================================================================
+# MAPEAMENTO BINÁRIO (.bmap)
+# ============================================================================
+#
+# Versão compacta do .map em TSV, gravada junto com ele na extração.
+# Em vez de repetir arquivo/all_blocks/work_blocks em toda linha, guarda um
+# cabeçalho por arquivo e as entradas em colunas de largura fixa, que são
+# lidas direto do mmap como arrays:
+#
+#     assinatura(4) + versão(4) + arquivos(4) + entradas(4)
+#     por arquivo: all_blocks(4) + work_blocks(4) + primeira_entrada(4)
+#                  + entradas(4) + tamanho_nome(4)
+#     nomes dos arquivos (UTF-8, concatenados) + padding até múltiplo de 8
+#     IDs(8 * N) + blocos(4 * N) + unknown(1 * N)
+#
+# Todos os inteiros são little-endian.
+
+BINARY_MAP_SIGNATURE = b'WWMB'
+BINARY_MAP_VERSION = 1
+BINARY_MAP_HEADER = struct.Struct('<4sIII')
+BINARY_MAP_FILE = struct.Struct('<IIIII')
+
+MapFile = namedtuple('MapFile', ['filename', 'all_blocks', 'work_blocks', 'blocks', 'unknown_codes', 'ids'])
+
+
+def binary_map_path(map_file: str) -> str:
+    """Caminho do .bmap correspondente a um .map"""
+    return os.path.splitext(map_file)[0] + '.bmap'
+
+
+class BinaryMapWriter:
+    """
+    Grava um .bmap. As colunas ficam em memória (13 bytes por entrada)
+    e o arquivo é escrito de uma vez em close(); se o bloco with terminar
+    com erro, nada é gravado.
+
+        with BinaryMapWriter(caminho) as bmap:
+            bmap.add_file(nome, all_blocks, work_blocks, blocos, unknown, ids)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._files = []
+        self._names = []
+        self._ids = bytearray()
+        self._blocks = array('I')
+        self._unknown = bytearray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def __len__(self) -> int:
+        return len(self._unknown)
+
+    def add_file(self, filename: str, all_blocks: int, work_blocks: int,
+                 blocks, unknown_codes: bytes, ids):
+        """
+        Adiciona as entradas de um .dat
+        blocks: índices das entradas; unknown_codes: um byte por entrada;
+        ids: sequência de IDs de 8 bytes (ou os IDs já concatenados)
+        """
+        first = len(self._unknown)
+        self._blocks.extend(blocks)
+        self._unknown += unknown_codes
+        self._ids += ids if isinstance(ids, (bytes, bytearray)) else b''.join(ids)
+
+        count = len(self._unknown) - first
+        if len(self._blocks) != len(self._unknown) or len(self._ids) != 8 * len(self._unknown):
+            raise ValueError(f"entradas inconsistentes em {filename}")
+
+        name = filename.encode('utf-8')
+        self._files.append((all_blocks, work_blocks, first, count, len(name)))
+        self._names.append(name)
+
+    def close(self):
+        """Grava o arquivo"""
+        blocks = array('I', self._blocks)
+        if sys.byteorder != 'little':
+            blocks.byteswap()
+
+        names = b''.join(self._names)
+        header_size = (BINARY_MAP_HEADER.size + BINARY_MAP_FILE.size * len(self._files) + len(names))
+
+        with open(self.path, 'wb') as f:
+            f.write(BINARY_MAP_HEADER.pack(BINARY_MAP_SIGNATURE, BINARY_MAP_VERSION,
+                                           len(self._files), len(self._unknown)))
+            for entry in self._files:
+                f.write(BINARY_MAP_FILE.pack(*entry))
+            f.write(names)
+            f.write(b'\x00' * (-header_size % 8))
+            f.write(self._ids)
+            f.write(blocks.tobytes())
+            f.write(self._unknown)
+
+
+class BinaryMap:
+    """
+    Leitor de .bmap via mmap
+
+    Iterar retorna um MapFile(filename, all_blocks, work_blocks, blocks,
+    unknown_codes, ids) por arquivo, na ordem gravada. blocks é uma lista de
+    índices, unknown_codes tem um byte por entrada e ids são os IDs de
+    8 bytes concatenados (ids[8*i:8*i+8]).
+
+        with BinaryMap(caminho) as bmap:
+            for entry in bmap:
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = None
+        self._view = None
+
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size < BINARY_MAP_HEADER.size:
+                raise ValueError("assinatura não reconhecida")
+
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+
+            signature, version, file_count, entry_count = BINARY_MAP_HEADER.unpack_from(self._view)
+            if signature != BINARY_MAP_SIGNATURE:
+                raise ValueError("assinatura não reconhecida")
+            if version != BINARY_MAP_VERSION:
+                raise ValueError(f"versão {version} não suportada")
+
+            pos = BINARY_MAP_HEADER.size
+            table = list(BINARY_MAP_FILE.iter_unpack(self._view[pos:pos + BINARY_MAP_FILE.size * file_count]))
+            pos += BINARY_MAP_FILE.size * file_count
+
+            self.files = []
+            for all_blocks, work_blocks, first, count, name_len in table:
+                filename = bytes(self._view[pos:pos + name_len]).decode('utf-8')
+                self.files.append((filename, all_blocks, work_blocks, first, count))
+                pos += name_len
+            pos += -pos % 8
+
+            self._ids_start = pos
+            self._blocks_start = pos + 8 * entry_count
+            self._unknown_start = self._blocks_start + 4 * entry_count
+            if self._unknown_start + entry_count > file_size:
+                raise ValueError("entradas truncadas")
+
+            self.entry_count = entry_count
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        """Quantidade de arquivos"""
+        return len(self.files)
+
+    def __iter__(self):
+        for index in range(len(self.files)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> MapFile:
+        filename, all_blocks, work_blocks, first, count = self.files[index]
+        view = self._view
+
+        start = self._blocks_start + 4 * first
+        with view[start:start + 4 * count] as column:
+            if sys.byteorder == 'little':
+                with column.cast('I') as values:
+                    blocks = values.tolist()
+            else:
+                blocks = list(struct.unpack(f'<{count}I', column))
+
+        start = self._unknown_start + first
+        unknown_codes = bytes(view[start:start + count])
+        start = self._ids_start + 8 * first
+        ids = bytes(view[start:start + 8 * count])
+
+        return MapFile(filename, all_blocks, work_blocks, blocks, unknown_codes, ids)
+
+    def close(self):
+        """Libera a view e o mapeamento do arquivo"""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class MapEntries:
+    """
+    Entradas de um .dat lidas do .map em TSV, guardadas em colunas
+    (mesmos atributos de MapFile): blocks é um array de índices,
+    unknown_codes tem um byte por entrada e ids são os IDs de 8 bytes
+    concatenados. Ocupa ~13 bytes por entrada, em vez de um dict por linha
+    """
+
+    __slots__ = ('filename', 'all_blocks', 'work_blocks', 'blocks', 'unknown_codes', 'ids')
+
+    def __init__(self, filename: str, all_blocks: int, work_blocks: int):
+        self.filename = filename
+        self.all_blocks = all_blocks
+        self.work_blocks = work_blocks
+        self.blocks = array('I')
+        self.unknown_codes = bytearray()
+        self.ids = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def append(self, block: int, unknown_hex: str, id_hex: str):
+        """Adiciona uma linha do .map (Unknown vazio vira 00, como no empacotamento)"""
+        self.blocks.append(block)
+        self.unknown_codes += bytes.fromhex(unknown_hex) if unknown_hex else b'\x00'
+        self.ids += bytes.fromhex(id_hex)
+
+
+def read_tsv_map(map_file: str) -> list:
+    """
+    Lê um .map em TSV (File, AllBlocks, WorkBlocks, Block, Unknown, ID)
+    Retorna: lista de MapEntries, um por arquivo na ordem em que aparecem
+    (linhas do mesmo arquivo são agrupadas mantendo a ordem)
+    """
+    files = OrderedDict()
+    with open(map_file, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader, None)  # Pula header
+        for row in reader:
+            if len(row) < 6:
+                continue
+            entries = files.get(row[0])
+            if entries is None:
+                entries = files[row[0]] = MapEntries(row[0], int(row[1]), int(row[2]))
+            entries.append(int(row[3]), row[4], row[5])
+    return list(files.values())
+
+
+def convert_map_to_binary(map_file: str, bmap_file: str = None, log_callback=None) -> bool:
+    """Converte um .map em TSV para .bmap (veja read_tsv_map)"""
+    try:
+        bmap_file = bmap_file or binary_map_path(map_file)
+        files = read_tsv_map(map_file)
+
+        with BinaryMapWriter(bmap_file) as writer:
+            for entries in files:
+                writer.add_file(entries.filename, entries.all_blocks, entries.work_blocks,
+                                entries.blocks, entries.unknown_codes, entries.ids)
+
+        if log_callback:
+            log_callback(f"✅ Mapeamento convertido: {os.path.basename(bmap_file)} "
+                         f"({len(writer)} entradas de {len(files)} arquivos, "
+                         f"{os.path.getsize(map_file):,} → {os.path.getsize(bmap_file):,} bytes)")
+        return True
+
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro ao converter mapeamento: {str(e)}")
+        return False
+
+
+# ============================================================================
+# ÍNDICE GLOBAL DE IDS (.idx)
+# ============================================================================
+#
+# ID → (arquivo .dat, bloco) de uma extração inteira, ordenado pelo valor
+# do ID (8 bytes lidos como inteiro little-endian). A busca é uma pesquisa
+# binária direto no mmap, sem carregar o mapeamento:
+#
+#     assinatura(4) + versão(4) + arquivos(4) + entradas(4)
+#     tamanho_nome(4) por arquivo + nomes (UTF-8) + padding até múltiplo de 8
+#     IDs(8 * N, ordenados) + arquivo(4 * N) + bloco(4 * N)
+
+ID_INDEX_SIGNATURE = b'WWMI'
+ID_INDEX_VERSION = 1
+ID_INDEX_HEADER = struct.Struct('<4sIII')
+
+
+def id_index_path(map_file: str) -> str:
+    """Caminho do .idx correspondente a um .map/.bmap"""
+    return os.path.splitext(map_file)[0] + '.idx'
+
+
+def _id_key(text_id) -> int:
+    """Valor do ID: aceita hex (como no TSV), 8 bytes ou inteiro"""
+    if isinstance(text_id, int):
+        return text_id
+    if isinstance(text_id, str):
+        text_id = bytes.fromhex(text_id)
+    return int.from_bytes(text_id, 'little')
+
+
+def build_id_index(bmap_file: str, index_file: str = None, log_callback=None) -> bool:
+    """Gera o .idx a partir de um .bmap"""
+    try:
+        index_file = index_file or id_index_path(bmap_file)
+
+        names = []
+        keys = array('Q')
+        files = array('I')
+        blocks = array('I')
+        with BinaryMap(bmap_file) as bmap:
+            for file_index, entry in enumerate(bmap):
+                names.append(entry.filename.encode('utf-8'))
+                ids = array('Q')
+                ids.frombytes(entry.ids)
+                if sys.byteorder != 'little':
+                    ids.byteswap()
+                keys.extend(ids)
+                files.extend([file_index] * len(entry.blocks))
+                blocks.extend(entry.blocks)
+
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        columns = [array('Q', (keys[i] for i in order)),
+                   array('I', (files[i] for i in order)),
+                   array('I', (blocks[i] for i in order))]
+        if sys.byteorder != 'little':
+            for column in columns:
+                column.byteswap()
+
+        header_size = ID_INDEX_HEADER.size + 4 * len(names) + sum(len(name) for name in names)
+        with open(index_file, 'wb') as f:
+            f.write(ID_INDEX_HEADER.pack(ID_INDEX_SIGNATURE, ID_INDEX_VERSION, len(names), len(keys)))
+            f.write(struct.pack(f'<{len(names)}I', *(len(name) for name in names)))
+            f.writelines(names)
+            f.write(b'\x00' * (-header_size % 8))
+            for column in columns:
+                f.write(column.tobytes())
+
+        if log_callback:
+            log_callback(f"✅ Índice de IDs: {os.path.basename(index_file)} ({len(keys)} entradas)")
+        return True
+
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro ao gerar índice de IDs: {str(e)}")
+        return False
+
+
+class IdIndex:
+    """
+    Leitor do .idx via mmap (pesquisa binária, O(log n) por ID)
+
+        with IdIndex(caminho) as index:
+            for filename, block in index.lookup('0a1b2c3d4e5f6071'):
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = None
+        self._view = None
+        self._columns = []
+
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size < ID_INDEX_HEADER.size:
+                raise ValueError("assinatura não reconhecida")
+
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+
+            signature, version, file_count, entry_count = ID_INDEX_HEADER.unpack_from(self._view)
+            if signature != ID_INDEX_SIGNATURE:
+                raise ValueError("assinatura não reconhecida")
+            if version != ID_INDEX_VERSION:
+                raise ValueError(f"versão {version} não suportada")
+
+            pos = ID_INDEX_HEADER.size
+            name_lengths = struct.unpack_from(f'<{file_count}I', self._view, pos)
+            pos += 4 * file_count
+            self.files = []
+            for name_len in name_lengths:
+                self.files.append(bytes(self._view[pos:pos + name_len]).decode('utf-8'))
+                pos += name_len
+            pos += -pos % 8
+
+            if pos + 16 * entry_count > file_size:
+                raise ValueError("entradas truncadas")
+
+            for fmt, size in (('Q', 8), ('I', 4), ('I', 4)):
+                column = self._view[pos:pos + size * entry_count]
+                pos += size * entry_count
+                if sys.byteorder == 'little':
+                    self._columns.append(column.cast(fmt))
+                else:
+                    self._columns.append(struct.unpack(f'<{entry_count}{fmt}', column))
+                    column.release()
+
+            self._keys, self._file_column, self._block_column = self._columns
+            self.entry_count = entry_count
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.entry_count
+
+    def __contains__(self, text_id) -> bool:
+        key = _id_key(text_id)
+        pos = bisect.bisect_left(self._keys, key)
+        return pos < self.entry_count and self._keys[pos] == key
+
+    def lookup(self, text_id) -> list:
+        """
+        Retorna [(arquivo .dat, bloco)] do ID (lista vazia se não existir)
+        text_id: hex (como no TSV), 8 bytes ou inteiro
+        """
+        key = _id_key(text_id)
+        start = bisect.bisect_left(self._keys, key)
+        end = bisect.bisect_right(self._keys, key, lo=start)
+        return [(self.files[self._file_column[i]], self._block_column[i]) for i in range(start, end)]
+
+    def close(self):
+        """Libera as views e o mapeamento do arquivo"""
+        for column in self._columns:
+            if isinstance(column, memoryview):
+                column.release()
+        self._columns = []
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# ============================================================================
+# CACHE DE BLOCOS COMPACTADOS
+# ============================================================================
+
+PACK_CACHE_NAME = "pack_cache"  # pack_cache.bin (frames) + pack_cache.json (índice)
+# Compacta o .bin quando os frames sem uso passam desta fração do arquivo
+PACK_CACHE_SLACK = 0.25
+
+
+class BlockCache:
+    """
+    Cache de frames zstd indexado pelo hash do .dat descompactado
+
+    Os frames ficam concatenados em <nome>.bin e o índice
+    {hash: [offset, tamanho, original]} em <nome>.json. É alimentado na
+    extração com os frames originais do container (original = 1) e no
+    empacotamento com os blocos recompactados, permitindo copiar sem
+    recompactar todo bloco cujo conteúdo não mudou. O frame é reaproveitado
+    como está, qualquer que seja o nível de compressão configurado no
+    empacotamento (os frames originais têm o nível usado pelo jogo).
+
+    Ao fechar, os frames que não são do container original nem foram usados
+    desde a abertura (versões antigas de blocos alterados) são descartados
+    quando passam de PACK_CACHE_SLACK do .bin; assim o cache não cresce a
+    cada empacotamento.
+    Seguro para uso a partir de várias threads.
+    """
+
+    def __init__(self, cache_dir: str, name: str = PACK_CACHE_NAME):
+        self.data_file = os.path.join(cache_dir, f"{name}.bin")
+        self.index_file = os.path.join(cache_dir, f"{name}.json")
+        self._lock = threading.Lock()
+        self._index = {}
+        self._used = set()
+
+        if os.path.exists(self.index_file) and os.path.exists(self.data_file):
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+
+            # Descarta o índice se o arquivo de dados estiver truncado
+            data_size = os.path.getsize(self.data_file)
+            if any(entry[0] + entry[1] > data_size for entry in self._index.values()):
+                self._index = {}
+            # Índices antigos não marcam os frames originais
+            for entry in self._index.values():
+                if len(entry) < 3:
+                    entry.append(0)
+
+        self._file = open(self.data_file, 'r+b' if self._index else 'w+b')
+        self._file.seek(0, os.SEEK_END)
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    @staticmethod
+    def key(data) -> str:
+        """Hash do conteúdo descompactado"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, key: str):
+        """Retorna o frame compactado ou None"""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        with self._lock:
+            self._used.add(key)
+            self._file.seek(offset)
+            frame = self._file.read(length)
+            self._file.seek(0, os.SEEK_END)
+        return frame
+
+    def put(self, key: str, frame, original: bool = False):
+        """
+        Adiciona um frame compactado (ignora se o hash já existe)
+        original marca um frame do container do jogo, mantido na compactação
+        """
+        with self._lock:
+            self._used.add(key)
+            entry = self._index.get(key)
+            if entry is not None:
+                if original and not entry[2]:
+                    entry[2] = 1
+                    self._dirty = True
+                return
+            offset = self._file.tell()
+            self._file.write(frame)
+            self._index[key] = [offset, len(frame), int(original)]
+            self._dirty = True
+
+    def compact(self) -> int:
+        """
+        Descarta os frames que não são originais nem foram usados desde a
+        abertura, se passarem de PACK_CACHE_SLACK do .bin (o arquivo é
+        regravado em um temporário e substituído)
+        Retorna quantos bytes foram liberados
+        """
+        with self._lock:
+            if not self._used:
+                return 0
+            live = sorted((entry[0], key) for key, entry in self._index.items()
+                          if entry[2] or key in self._used)
+            data_size = self._file.seek(0, os.SEEK_END)
+            freed = data_size - sum(self._index[key][1] for _, key in live)
+            if freed <= data_size * PACK_CACHE_SLACK:
+                return 0
+
+            temp_file = f"{self.data_file}.tmp"
+            index = {}
+            try:
+                with open(temp_file, 'wb') as out:
+                    for offset, key in live:
+                        _, length, original = self._index[key]
+                        self._file.seek(offset)
+                        index[key] = [out.tell(), length, original]
+                        out.write(self._file.read(length))
+            except OSError:
+                # Sem espaço em disco, por exemplo: o cache fica como está
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                self._file.seek(0, os.SEEK_END)
+                return 0
+
+            # Sem índice, uma interrupção antes de gravar o novo só esvazia o cache
+            if os.path.exists(self.index_file):
+                os.remove(self.index_file)
+            self._file.close()
+            os.replace(temp_file, self.data_file)
+            self._file = open(self.data_file, 'r+b')
+            self._file.seek(0, os.SEEK_END)
+            self._index = index
+            self._dirty = True
+        self.save()
+        return freed
+
+    def save(self):
+        """Grava o índice em disco"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._file.flush()
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            self._dirty = False
+
+    def close(self):
+        """Compacta, salva o índice e fecha o arquivo de dados"""
+        if self._file is not None:
+            self.compact()
+            self.save()
+            self._file.close()
+            self._file = None
+
+
+# ============================================================================
+# DICIONÁRIO ZSTD (ANÁLISE)
+# ============================================================================
+#
+# Os blocos de texto são pequenos e muito parecidos entre si. Um dicionário
+# zstd treinado com eles melhora bastante a compactação, mas o jogo não
+# conhece o dicionário: o container empacotado continua usando frames
+# zstd comuns. O dicionário fica na sessão apenas para análise/benchmark.
+
+DICT_FILE_NAME = "text_blocks.zdict"
+DEFAULT_DICT_SIZE = 112640  # 110 KB, mesmo padrão do zstd --train
+MAX_DICT_SAMPLES_BYTES = 100 * 1024 * 1024
+
+
+def iter_text_blocks(dat_dir: str):
+    """Itera (nome, dados) dos .dat de texto de uma pasta, em ordem"""
+    for filename in sorted(f for f in os.listdir(dat_dir) if f.endswith('.dat')):
+        with open(os.path.join(dat_dir, filename), 'rb') as f:
+            f.seek(16)
+            if f.read(4) != TEXT_BLOCK_SIGNATURE:
+                continue
+            f.seek(0)
+            data = f.read()
+        yield filename, data
+
+
+def train_text_dictionary(dat_dir: str, dict_file: str, dict_size: int = DEFAULT_DICT_SIZE,
+                          log_callback=None) -> bool:
+    """
+    Treina um dicionário zstd com os blocos de texto extraídos e salva em dict_file
+    Usa no máximo MAX_DICT_SAMPLES_BYTES de amostras
+    """
+    try:
+        samples = []
+        total = 0
+        for _, data in iter_text_blocks(dat_dir):
+            if total + len(data) > MAX_DICT_SAMPLES_BYTES:
+                break
+            samples.append(data)
+            total += len(data)
+
+        if not samples:
+            if log_callback:
+                log_callback("❌ Nenhum bloco de texto encontrado para treinar o dicionário")
+            return False
+
+        if log_callback:
+            log_callback(f"🧠 Treinando dicionário com {len(samples)} blocos ({total:,} bytes)...")
+
+        zstd_dict = pyzstd.train_dict(samples, dict_size)
+        with open(dict_file, 'wb') as f:
+            f.write(zstd_dict.dict_content)
+
+        if log_callback:
+            log_callback(f"✅ Dicionário salvo: {os.path.basename(dict_file)} "
+                         f"({len(zstd_dict.dict_content):,} bytes, id {zstd_dict.dict_id})")
+        return True
+
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro ao treinar dicionário: {str(e)}")
+        return False
+
+
+def benchmark_text_dictionary(dat_dir: str, dict_file: str, level: int = 3,
+                              rounds: int = 3, log_callback=None) -> dict:
+    """
+    Compara pyzstd.compress padrão x compactação com o dicionário treinado
+    nos blocos de texto (taxa de compactação e velocidade de descompactação)
+
+    Retorna: dict com as estatísticas (vazio em caso de erro)
+    """
+    try:
+        with open(dict_file, 'rb') as f:
+            zstd_dict = pyzstd.ZstdDict(f.read())
+
+        blocks = [data for _, data in iter_text_blocks(dat_dir)]
+        if not blocks:
+            if log_callback:
+                log_callback("❌ Nenhum bloco de texto encontrado")
+            return {}
+
+        plain = [pyzstd.compress(data, level) for data in blocks]
+        with_dict = [pyzstd.compress(data, level, zstd_dict=zstd_dict) for data in blocks]
+
+        def best_time(frames, **kwargs):
+            best = float('inf')
+            for _ in range(max(1, rounds)):
+                start = time.perf_counter()
+                for frame in frames:
+                    pyzstd.decompress(frame, **kwargs)
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        raw_size = sum(len(data) for data in blocks)
+        stats = {
+            'blocks': len(blocks),
+            'raw_size': raw_size,
+            'dict_size': len(zstd_dict.dict_content),
+            'plain_size': sum(len(frame) for frame in plain),
+            'dict_size_total': sum(len(frame) for frame in with_dict),
+            'plain_time': best_time(plain),
+            'dict_time': best_time(with_dict, zstd_dict=zstd_dict),
+        }
+        stats['plain_ratio'] = raw_size / stats['plain_size']
+        stats['dict_ratio'] = raw_size / stats['dict_size_total']
+        stats['ratio_gain'] = stats['dict_ratio'] / stats['plain_ratio'] - 1
+        stats['speed_gain'] = stats['plain_time'] / stats['dict_time'] - 1
+
+        if log_callback:
+            mb = raw_size / (1024 * 1024)
+            log_callback("")
+            log_callback("=" * 50)
+            log_callback("📊 DICIONÁRIO ZSTD - BLOCOS DE TEXTO")
+            log_callback("=" * 50)
+            log_callback(f"📁 Blocos de texto:          {stats['blocks']:,} ({raw_size:,} bytes)")
+            log_callback(f"📚 Dicionário:               {stats['dict_size']:,} bytes")
+            log_callback(f"🗜️  Padrão (nível {level}):        {stats['plain_size']:,} bytes "
+                         f"(taxa {stats['plain_ratio']:.2f}x)")
+            log_callback(f"🗜️  Com dicionário:           {stats['dict_size_total']:,} bytes "
+                         f"(taxa {stats['dict_ratio']:.2f}x)")
+            log_callback(f"⚡ Descompactação padrão:    {mb / stats['plain_time']:,.1f} MB/s")
+            log_callback(f"⚡ Descompactação c/ dict:   {mb / stats['dict_time']:,.1f} MB/s")
+            log_callback("-" * 50)
+            log_callback(f"📈 Ganho de taxa:            {stats['ratio_gain']:+.1%}")
+            log_callback(f"📈 Ganho de velocidade:      {stats['speed_gain']:+.1%}")
+            log_callback("=" * 50)
+
+        return stats
+
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro no benchmark do dicionário: {str(e)}")
+        return {}
+
+
+# ============================================================================
+# LINHA DE COMANDO
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="WWM Container - Ferramentas de linha de comando",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  python wwm_container.py convert-map translate_words_map_en.map
+  python wwm_container.py build-index translate_words_map_en.bmap
+  python wwm_container.py lookup translate_words_map_en.idx 0a1b2c3d4e5f6071
+  python wwm_container.py verify-pack translate_words_map_en bin/translate_words_map_en
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert = subparsers.add_parser('convert-map', help='Converte um .map (TSV) para .bmap')
+    convert.add_argument('map_file', help='Arquivo .map gerado na extração')
+    convert.add_argument('--output', '-out', default=None, help='Arquivo .bmap (padrão: ao lado do .map)')
+
+    index = subparsers.add_parser('build-index', help='Gera o índice de IDs (.idx) de um .bmap')
+    index.add_argument('bmap_file', help='Arquivo .bmap gerado na extração (ou por convert-map)')
+    index.add_argument('--output', '-out', default=None, help='Arquivo .idx (padrão: ao lado do .bmap)')
+
+    lookup = subparsers.add_parser('lookup', help='Mostra o .dat e o bloco de cada ID')
+    lookup.add_argument('index_file', help='Arquivo .idx')
+    lookup.add_argument('ids', nargs='+', help='IDs em hex (16 caracteres, como no TSV)')
+
+    verify = subparsers.add_parser('verify-pack', help='Compara um container reempacotado com o original')
+    verify.add_argument('original', help='Container original do jogo')
+    verify.add_argument('repacked', help='Container gerado pelo empacotamento')
+    verify.add_argument('--workers', '-w', type=int, default=os.cpu_count() or 1,
+                        help='Blocos comparados em paralelo')
+
+    args = parser.parse_args()
+
+    if args.command == 'convert-map':
+        if not convert_map_to_binary(args.map_file, args.output, print):
+            sys.exit(1)
+    elif args.command == 'build-index':
+        if not build_id_index(args.bmap_file, args.output, print):
+            sys.exit(1)
+    elif args.command == 'lookup':
+        with IdIndex(args.index_file) as id_index:
+            for text_id in args.ids:
+                matches = id_index.lookup(text_id)
+                if not matches:
+                    print(f"{text_id}\t❌ não encontrado")
+                for filename, block in matches:
+                    print(f"{text_id}\t{filename}\t{block}")
+    elif args.command == 'verify-pack':
+        stats = compare_containers(args.original, args.repacked, args.workers, print)
+        if not stats or stats['mismatches']:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWM Layout - Containers de tradução dentro da pasta HD do jogo
+Estrutura compartilhada entre o launcher (instalação) e o tradutor (lote)
+
+Autor: rodrigomiquilino
+Projeto: https://github.com/rodrigomiquilino/wwm_brasileiro
+Licença: MIT
+"""
+
+# Arquivos de tradução - estrutura de pastas relativas ao HD
+# Cada pasta contém os mesmos arquivos, mas com conteúdo diferente
+TRANSLATION_STRUCTURE = {
+    "oversea/locale": [
+        "translate_words_map_en",
+        "translate_words_map_en_diff"
+    ],
+    "locale": [
+        "translate_words_map_en",
+        "translate_words_map_en_diff"
+    ]
+}
+
+# Lista plana de nomes de arquivos (para compatibilidade)
+TRANSLATION_FILES = ["translate_words_map_en", "translate_words_map_en_diff"]
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWM Memória de Tradução - Sugestões para strings novas
+Procura, nas traduções já existentes, os textos em inglês mais parecidos
+com cada string que falta traduzir e mostra as traduções deles
+
+Autor: rodrigomiquilino
+Projeto: https://github.com/rodrigomiquilino/wwm_brasileiro
+Licença: MIT
+
+A memória é um índice invertido de n-gramas de caracteres (trigramas) dos
+textos originais já traduzidos: cada trigrama aponta para os textos que o
+contêm. Uma busca conta os trigramas em comum começando pelos mais raros,
+que são os que distinguem um texto do outro, e confere os melhores
+candidatos com a similaridade exata (coeficiente de Dice dos trigramas).
+
+Uso:
+    python wwm_memoria.py --translated traducao.tsv --original original.tsv --missing mesclado_faltando.tsv
+
+    traducao.tsv: TSV traduzido (pt-br)
+    original.tsv: TSV em inglês da mesma versão da tradução
+    mesclado_faltando.tsv: lista de faltantes gerada pelo wwm_merge_tsv.py
+    Saída: mesclado_sugestoes.tsv (ID, OriginalText e as k sugestões)
+"""
+
+import os
+import csv
+import sys
+import time
+import argparse
+from math import ceil, floor
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import compress, islice
+from collections import Counter, defaultdict
+
+from wwm_tsv import iter_tsv_columns, load_tsv_columns
+
+
+# ============================================================================
+# CONFIGURAÇÃO
+# ============================================================================
+
+APP_NAME = "WWM Memória de Tradução"
+APP_VERSION = "1.0.0"
+
+# Tamanho dos n-gramas de caracteres do índice
+NGRAM = 3
+
+# Sugestões por string e similaridade mínima (0-1) de uma sugestão
+DEFAULT_SUGGESTIONS = 3
+DEFAULT_MIN_SCORE = 0.5
+
+# Máximo de entradas de índice contadas por busca: os trigramas raros são
+# contados primeiro e os muito comuns (" th", "the"...) ficam de fora quando
+# o orçamento acaba - quase não distinguem um texto do outro
+SEARCH_BUDGET = 10000
+
+# Textos pré-selecionados pela contagem e, destes, candidatos conferidos
+# com a similaridade exata por busca
+SEARCH_POOL = 512
+SEARCH_CANDIDATES = 64
+
+
+# ============================================================================
+# MEMÓRIA DE TRADUÇÃO
+# ============================================================================
+
+def _normalize(text: str) -> str:
+    """Texto comparado: minúsculas e espaços colapsados"""
+    return ' '.join(text.casefold().split())
+
+
+def _grams(key: str) -> set:
+    """Trigramas de um texto normalizado (com espaço nas pontas, para as bordas das palavras)"""
+    text = f" {key} "
+    return set(map(''.join, zip(*[text[i:] for i in range(NGRAM)])))
+
+
+class TranslationMemory:
+    """
+    Memória de tradução com índice invertido de trigramas
+
+    Cada texto original (normalizado) entra uma vez; textos repetidos ficam
+    com a primeira tradução. Os textos são numerados do que tem menos
+    trigramas ao que tem mais e o índice guarda, por trigrama, um array
+    crescente com os números dos textos que o contêm - assim os textos de uma
+    faixa de tamanhos são um trecho contínuo de cada array.
+    """
+
+    def __init__(self):
+        self._sources = []
+        self._translations = []
+        self._keys = []
+        self._seen = set()
+        self._sizes = array('I')
+        self._index = {}
+        self._built = True
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, source: str, translation: str) -> bool:
+        """Adiciona um par original/tradução; retorna False se o texto já existe ou é vazio"""
+        key = _normalize(source)
+        if not key or key in self._seen:
+            return False
+
+        self._seen.add(key)
+        self._sources.append(source)
+        self._translations.append(translation)
+        self._keys.append(key)
+        self._sizes.append(len(_grams(key)))
+        self._built = False
+        return True
+
+    def build(self):
+        """Renumera os textos por tamanho e monta o índice (feito na primeira busca, se preciso)"""
+        order = sorted(range(len(self._keys)), key=self._sizes.__getitem__)
+        self._sources = [self._sources[doc] for doc in order]
+        self._translations = [self._translations[doc] for doc in order]
+        self._keys = [self._keys[doc] for doc in order]
+        self._sizes = array('I', sorted(self._sizes))
+
+        index = defaultdict(partial(array, 'I'))
+        for doc, key in enumerate(self._keys):
+            for gram in _grams(key):
+                index[gram].append(doc)
+        self._index = dict(index)
+        self._built = True
+
+    def search(self, text: str, k: int = DEFAULT_SUGGESTIONS, min_score: float = DEFAULT_MIN_SCORE) -> list:
+        """
+        Os k textos já traduzidos mais parecidos com text
+
+        Retorna: [(similaridade 0-1, original, tradução)] da mais parecida
+        para a menos parecida, só com similaridade >= min_score
+        """
+        if not self._built:
+            self.build()
+
+        key = _normalize(text)
+        if not key:
+            return []
+        grams = _grams(key)
+        size = len(grams)
+
+        # Filtro de tamanho: com m trigramas na busca, só um texto com n
+        # trigramas entre m*s/(2-s) e m*(2-s)/s pode ter similaridade s
+        sizes = self._sizes
+        first, last = 0, len(sizes)
+        if min_score > 0:
+            first = bisect_left(sizes, ceil(size * min_score / (2 - min_score)))
+            last = bisect_right(sizes, floor(size * (2 - min_score) / min_score))
+
+        spans = {}
+        for gram in grams:
+            postings = self._index.get(gram)
+            if postings is not None:
+                start = bisect_left(postings, first)
+                end = bisect_left(postings, last, start)
+                if end > start:
+                    spans[gram] = (end - start, start, postings)
+        if not spans:
+            return []
+
+        # Ordem de contagem: o trigrama mais raro de cada palavra, depois o
+        # segundo mais raro de cada uma e assim por diante (por último os que
+        # juntam duas palavras). O orçamento se espalha pelo texto todo em vez
+        # de ir inteiro para os trigramas de uma palavra rara só - uma palavra
+        # nova no meio de um texto já traduzido, por exemplo
+        rounds = []
+        for word in set(key.split(' ')):
+            word_grams = sorted((spans[gram][0], gram) for gram in _grams(word) if gram in spans)
+            rounds += [(rank, length, gram) for rank, (length, gram) in enumerate(word_grams)]
+        rounds.sort()
+        ordered = list(dict.fromkeys(gram for _, _, gram in rounds))
+        ordered += sorted(spans.keys() - set(ordered), key=lambda gram: spans[gram][0])
+
+        # Conta os trigramas em comum, na ordem acima, até acabar o orçamento
+        counts = Counter()
+        budget = SEARCH_BUDGET
+        counted = 0
+        for length, start, postings in map(spans.__getitem__, ordered):
+            if length > budget and counts:
+                continue
+            counts.update(postings[start:start + length])
+            budget -= length
+            counted += 1
+
+        # Pré-seleção: os textos com mais trigramas em comum (até SEARCH_POOL,
+        # pelo histograma das contagens) e, entre eles, os de maior
+        # similaridade estimada - a fração dos trigramas contados que o texto
+        # tem vale para todos os m, limitada aos n trigramas do texto
+        scale = size / counted
+        if len(counts) > SEARCH_CANDIDATES:
+            histogram = Counter(counts.values())
+            floor_count = None
+            total = 0
+            for common in sorted(histogram, reverse=True):
+                total += histogram[common]
+                if total > SEARCH_POOL and floor_count is not None:
+                    break
+                floor_count = common
+            pool = islice(compress(counts, map(floor_count.__le__, counts.values())), SEARCH_POOL)
+            estimates = sorted(((min(counts[doc] * scale, sizes[doc]) / (size + sizes[doc]), doc) for doc in pool),
+                               reverse=True)
+            candidates = [doc for _, doc in estimates[:SEARCH_CANDIDATES]]
+        else:
+            candidates = list(counts)
+
+        # Similaridade exata (Dice) dos candidatos
+        results = []
+        keys = self._keys
+        for doc in candidates:
+            common = len(grams & _grams(keys[doc]))
+            score = 2 * common / (size + sizes[doc])
+            if score >= min_score:
+                results.append((score, doc))
+        results.sort(key=lambda item: (-item[0], item[1]))
+
+        return [(score, self._sources[doc], self._translations[doc]) for score, doc in results[:k]]
+
+
+def build_memory(translated_file: str, original_file: str, log_callback=None,
+                 cache: bool = False) -> TranslationMemory:
+    """
+    Monta a memória a partir do TSV traduzido e do TSV em inglês da mesma
+    versão (pares pelo ID). Strings sem tradução ou com a tradução igual ao
+    original (inglês copiado pelo merge) ficam de fora; com cache, os TSVs
+    vêm dos snapshots de load_tsv_columns
+
+    Retorna: TranslationMemory (None em caso de erro)
+    """
+    try:
+        start = time.perf_counter()
+        ids, texts = load_tsv_columns(translated_file, cache=cache)
+        translations = {}
+        for text_id, text in zip(map(str.strip, ids), texts):
+            if text and text.strip():
+                translations[text_id] = text
+        del ids, texts
+
+        memory = TranslationMemory()
+        ids, texts = load_tsv_columns(original_file, cache=cache)
+        for text_id, source in zip(map(str.strip, ids), texts):
+            translation = translations.get(text_id)
+            if translation is not None and source and translation.strip() != source.strip():
+                memory.add(source, translation)
+        memory.build()
+
+        if log_callback:
+            log_callback(f"🧠 Memória de tradução: {len(memory):,} textos traduzidos "
+                         f"({time.perf_counter() - start:.1f}s)")
+        return memory
+
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro ao montar a memória de tradução: {str(e)}")
+        return None
+
+
+def save_suggestions(
+    memory: TranslationMemory,
+    missing_file: str,
+    output_file: str = None,
+    k: int = DEFAULT_SUGGESTIONS,
+    min_score: float = DEFAULT_MIN_SCORE,
+    log_callback=None
+) -> bool:
+    """
+    Anota a lista de faltantes com as k sugestões da memória para cada string
+    Saída (padrão: _faltando.tsv -> _sugestoes.tsv):
+        ID, OriginalText, Score1, Source1, Translation1, ..., Translationk
+    """
+    try:
+        if output_file is None:
+            output_file = missing_file.replace('_faltando.tsv', '_sugestoes.tsv')
+            if output_file == missing_file:
+                output_file = missing_file.replace('.tsv', '_sugestoes.tsv')
+
+        header = ['ID', 'OriginalText']
+        for rank in range(1, k + 1):
+            header += [f'Score{rank}', f'Source{rank}', f'Translation{rank}']
+
+        count = 0
+        with_suggestion = 0
+        start = time.perf_counter()
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter='\t')
+            writer.writerow(header)
+
+            for ids, texts in iter_tsv_columns(missing_file):
+                for text_id, text in zip(ids, texts):
+                    row = [text_id, text or ""]
+                    for score, source, translation in memory.search(text or "", k, min_score):
+                        row += [f"{score:.0%}", source, translation]
+                    writer.writerow(row)
+                    count += 1
+                    if len(row) > 2:
+                        with_suggestion += 1
+        elapsed = time.perf_counter() - start
+
+        if log_callback:
+            per_query = elapsed / count * 1000 if count else 0
+            log_callback(f"💡 Sugestões: {output_file} ({with_suggestion:,} de {count:,} strings, "
+                         f"{per_query:.2f} ms/string)")
+        return True
+
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro ao salvar sugestões: {str(e)}")
+        return False
+
+
+# ============================================================================
+# LINHA DE COMANDO
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="WWM Memória de Tradução - Sugestões para as strings faltantes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplo:
+  python wwm_memoria.py --translated traducao.tsv --original original_antigo.tsv --missing mesclado_faltando.tsv
+  python wwm_memoria.py --translated traducao.tsv --original original_antigo.tsv --query "Defeat the bandits"
+        """
+    )
+
+    parser.add_argument('--translated', '-t', required=True, help='TSV traduzido (pt-br)')
+    parser.add_argument('--original', '-o', required=True, help='TSV em inglês da mesma versão da tradução')
+    parser.add_argument('--missing', '-m', help='Lista de faltantes (_faltando.tsv) a anotar')
+    parser.add_argument('--output', '-out', help='Arquivo de saída (padrão: _sugestoes.tsv)')
+    parser.add_argument('--query', '-q', help='Mostra as sugestões para um texto')
+    parser.add_argument('-k', type=int, default=DEFAULT_SUGGESTIONS, help='Sugestões por string')
+    parser.add_argument('--min-score', type=float, default=DEFAULT_MIN_SCORE,
+                        help='Similaridade mínima das sugestões (0-1)')
+
+    args = parser.parse_args()
+
+    if not args.missing and not args.query:
+        parser.error("informe --missing ou --query")
+
+    print(f"\n🧠 {APP_NAME} v{APP_VERSION}")
+    print("=" * 50)
+
+    for filepath in (args.translated, args.original, args.missing):
+        if filepath and not os.path.exists(filepath):
+            print(f"❌ Arquivo não encontrado: {filepath}")
+            sys.exit(1)
+
+    memory = build_memory(args.translated, args.original, print)
+    if memory is None:
+        sys.exit(1)
+
+    if args.query:
+        results = memory.search(args.query, args.k, args.min_score)
+        if not results:
+            print("   Nenhuma sugestão")
+        for score, source, translation in results:
+            print(f"   {score:4.0%}  {source}")
+            print(f"         → {translation}")
+
+    if args.missing:
+        if not save_suggestions(memory, args.missing, args.output, args.k, args.min_score, print):
+            sys.exit(1)
+        print("\n✅ Processo concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,18 +18,27 @@ Uso:
 Fluxo de trabalho após atualização do jogo:
     1. Extrair arquivos do jogo atualizado (gera novo.tsv + novo.map)
     2. Mesclar: traducao_atual.tsv + novo.tsv = mesclado.tsv
+       (com --old-original, o original da tradução atual, as strings cujo
+       inglês mudou vão para mesclado_desatualizado.tsv)
     3. Traduzir strings faltantes no mesclado.tsv
+       (com --suggest, mesclado_sugestoes.tsv traz para cada faltante as
+       traduções de textos parecidos, da memória de tradução)
     4. Empacotar usando mesclado.tsv + novo.map (o .map do arquivo NOVO!)
 """
 
 import os
 import sys
 import csv
+import hashlib
 import argparse
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from collections import OrderedDict
 
+from wwm_tsv import iter_tsv_columns, load_tsv_columns
+from wwm_memoria import build_memory, save_suggestions
+
 try:
     from PyQt5.QtWidgets import (
         QApplication, QMainWindow, QWidget, QPushButton, QTextEdit,
@@ -50,15 +59,27 @@ except ImportError:
 APP_NAME = "WWM Merge TSV"
 APP_VERSION = "1.1.0"
 
+# Quantidade de strings novas/removidas listadas no relatório
+REPORT_SAMPLE = 50
+
 
 # ============================================================================
 # FUNÇÕES DE MERGE
 # ============================================================================
 
-def load_tsv_simple(filepath: str, log_callback=None) -> OrderedDict:
+def _fill_missing_texts(texts: list) -> list:
+    """Linhas só com ID (sem texto) ficam com texto vazio"""
+    if None in texts:
+        return ["" if text is None else text for text in texts]
+    return texts
+
+
+def load_tsv_simple(filepath: str, log_callback=None, cache: bool = False) -> OrderedDict:
     """
     Carrega um arquivo TSV no formato do wwm_tradutor_ptbr.py
     Formato: ID<tab>Texto (2 colunas)
+    Com cache (opcional), reaproveita o snapshot da última leitura se o TSV
+    não mudou
     
     Retorna: OrderedDict {id: texto} mantendo a ordem original
     """
@@ -70,24 +91,13 @@ def load_tsv_simple(filepath: str, log_callback=None) -> OrderedDict:
         return data
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f, delimiter='\t')
-            header = next(reader, None)
-            
-            if not header:
-                if log_callback:
-                    log_callback(f"❌ Arquivo vazio: {filepath}")
-                return data
-            
-            for row in reader:
-                if len(row) >= 2:
-                    text_id = row[0].strip()
-                    text = row[1]
-                    data[text_id] = text
-                elif len(row) == 1:
-                    # Linha só com ID (sem texto)
-                    text_id = row[0].strip()
-                    data[text_id] = ""
+        if os.path.getsize(filepath) == 0:
+            if log_callback:
+                log_callback(f"❌ Arquivo vazio: {filepath}")
+            return data
+        
+        ids, texts = load_tsv_columns(filepath, cache=cache)
+        data.update(zip(map(str.strip, ids), _fill_missing_texts(texts)))
         
         if log_callback:
             log_callback(f"✓ Carregado: {os.path.basename(filepath)} ({len(data):,} strings)")
@@ -99,6 +109,38 @@ def load_tsv_simple(filepath: str, log_callback=None) -> OrderedDict:
     return data
 
 
+def iter_tsv_simple(filepath: str):
+    """
+    Lê um arquivo TSV no formato do wwm_tradutor_ptbr.py em blocos,
+    sem carregar o arquivo inteiro (mesmas regras de load_tsv_simple)
+    
+    Gera: tuplas (id, texto); o cabeçalho é ignorado
+    """
+    for ids, texts in iter_tsv_columns(filepath):
+        yield from zip(map(str.strip, ids), _fill_missing_texts(texts))
+
+
+def _log_merge_stats(stats: dict, log_callback=None):
+    """Mostra as estatísticas do merge no log"""
+    if not log_callback:
+        return
+    log_callback("")
+    log_callback("=" * 50)
+    log_callback("📊 ESTATÍSTICAS DO MERGE")
+    log_callback("=" * 50)
+    log_callback(f"📁 Arquivo traduzido antigo: {stats['total_old']:,} strings")
+    log_callback(f"📁 Arquivo original novo:    {stats['total_new']:,} strings")
+    log_callback(f"📁 Diferença:                {stats['total_new'] - stats['total_old']:+,} strings")
+    log_callback("-" * 50)
+    log_callback(f"✅ Traduções preservadas:    {stats['preserved']:,}")
+    log_callback(f"🆕 Strings a traduzir:       {stats['new_strings']:,}")
+    log_callback(f"🗑️  Strings removidas:       {stats['removed']:,}")
+    if 'stale' in stats:
+        log_callback(f"🔁 Traduções reaproveitadas: {stats['carried']:,}")
+        log_callback(f"🔎 Inglês alterado (revisar): {stats['stale']:,}")
+    log_callback("=" * 50)
+
+
 def merge_translations(
     old_translated: OrderedDict,
     new_original: OrderedDict,
@@ -158,19 +200,7 @@ def merge_translations(
             stats['new_strings'] += 1
     
     # Log de estatísticas
-    if log_callback:
-        log_callback("")
-        log_callback("=" * 50)
-        log_callback("📊 ESTATÍSTICAS DO MERGE")
-        log_callback("=" * 50)
-        log_callback(f"📁 Arquivo traduzido antigo: {stats['total_old']:,} strings")
-        log_callback(f"📁 Arquivo original novo:    {stats['total_new']:,} strings")
-        log_callback(f"📁 Diferença:                {stats['total_new'] - stats['total_old']:+,} strings")
-        log_callback("-" * 50)
-        log_callback(f"✅ Traduções preservadas:    {stats['preserved']:,}")
-        log_callback(f"🆕 Strings a traduzir:       {stats['new_strings']:,}")
-        log_callback(f"🗑️  Strings removidas:       {stats['removed']:,}")
-        log_callback("=" * 50)
+    _log_merge_stats(stats, log_callback)
     
     return merged, stats
 
@@ -248,6 +278,55 @@ def save_untranslated_list(
         return False
 
 
+def _write_report(report_file: str, stats: dict, added_count: int, added: list,
+                  removed_count: int, removed: list):
+    """
+    Escreve o relatório de mudanças
+    added/removed: amostras [(id, texto)] das strings novas e removidas
+    """
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 60 + "\n")
+        f.write("WWM MERGE TSV - RELATÓRIO\n")
+        f.write(f"Data: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write("=" * 60 + "\n\n")
+        
+        f.write("ESTATÍSTICAS\n")
+        f.write("-" * 40 + "\n")
+        f.write(f"Arquivo traduzido antigo: {stats['total_old']:,} strings\n")
+        f.write(f"Arquivo original novo:    {stats['total_new']:,} strings\n")
+        f.write(f"Diferença:                {stats['total_new'] - stats['total_old']:+,} strings\n\n")
+        
+        f.write(f"Traduções preservadas:    {stats['preserved']:,}\n")
+        f.write(f"Strings a traduzir:       {stats['new_strings']:,}\n")
+        f.write(f"Strings removidas:        {stats['removed']:,}\n")
+        if 'stale' in stats:
+            f.write(f"Traduções reaproveitadas: {stats['carried']:,}\n")
+            f.write(f"Inglês alterado (revisar): {stats['stale']:,}\n")
+        f.write("\n")
+        
+        # Lista strings novas (primeiras 50)
+        if added_count:
+            f.write(f"STRINGS NOVAS ({added_count} total, mostrando {REPORT_SAMPLE})\n")
+            f.write("-" * 40 + "\n")
+            for text_id, text in added:
+                text = text[:60].replace('\n', ' ')
+                f.write(f"{text_id}: {text}...\n")
+            f.write("\n")
+        
+        # Lista strings removidas (primeiras 50)
+        if removed_count:
+            f.write(f"STRINGS REMOVIDAS ({removed_count} total, mostrando {REPORT_SAMPLE})\n")
+            f.write("-" * 40 + "\n")
+            for text_id, text in removed:
+                text = text[:60].replace('\n', ' ') if text else "(vazio)"
+                f.write(f"{text_id}: {text}...\n")
+            f.write("\n")
+        
+        f.write("=" * 60 + "\n")
+        f.write("IMPORTANTE: Use o arquivo .map do NOVO original para empacotar!\n")
+        f.write("=" * 60 + "\n")
+
+
 def save_report(
     stats: dict,
     old_translated: OrderedDict,
@@ -267,43 +346,9 @@ def save_report(
         added_ids = new_ids - old_ids
         removed_ids = old_ids - new_ids
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("WWM MERGE TSV - RELATÓRIO\n")
-            f.write(f"Data: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            f.write("ESTATÍSTICAS\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Arquivo traduzido antigo: {stats['total_old']:,} strings\n")
-            f.write(f"Arquivo original novo:    {stats['total_new']:,} strings\n")
-            f.write(f"Diferença:                {stats['total_new'] - stats['total_old']:+,} strings\n\n")
-            
-            f.write(f"Traduções preservadas:    {stats['preserved']:,}\n")
-            f.write(f"Strings a traduzir:       {stats['new_strings']:,}\n")
-            f.write(f"Strings removidas:        {stats['removed']:,}\n\n")
-            
-            # Lista strings novas (primeiras 50)
-            if added_ids:
-                f.write(f"STRINGS NOVAS ({len(added_ids)} total, mostrando 50)\n")
-                f.write("-" * 40 + "\n")
-                for text_id in list(added_ids)[:50]:
-                    text = new_original[text_id][:60].replace('\n', ' ')
-                    f.write(f"{text_id}: {text}...\n")
-                f.write("\n")
-            
-            # Lista strings removidas (primeiras 50)
-            if removed_ids:
-                f.write(f"STRINGS REMOVIDAS ({len(removed_ids)} total, mostrando 50)\n")
-                f.write("-" * 40 + "\n")
-                for text_id in list(removed_ids)[:50]:
-                    text = old_translated[text_id][:60].replace('\n', ' ') if old_translated[text_id] else "(vazio)"
-                    f.write(f"{text_id}: {text}...\n")
-                f.write("\n")
-            
-            f.write("=" * 60 + "\n")
-            f.write("IMPORTANTE: Use o arquivo .map do NOVO original para empacotar!\n")
-            f.write("=" * 60 + "\n")
+        added = [(text_id, new_original[text_id]) for text_id in list(added_ids)[:REPORT_SAMPLE]]
+        removed = [(text_id, old_translated[text_id]) for text_id in list(removed_ids)[:REPORT_SAMPLE]]
+        _write_report(report_file, stats, len(added_ids), added, len(removed_ids), removed)
         
         if log_callback:
             log_callback(f"📄 Relatório: {report_file}")
@@ -316,6 +361,220 @@ def save_report(
         return False
 
 
+def save_suggestions_list(
+    old_file: str,
+    source_file: str,
+    output_file: str,
+    log_callback=None,
+    cache: bool = False
+) -> bool:
+    """
+    Anota a lista de faltantes (_faltando.tsv) com sugestões da memória de
+    tradução montada com as traduções antigas (_sugestoes.tsv)
+    source_file: inglês da versão traduzida (--old-original); sem ele, o
+    original novo (pares de IDs cujo inglês mudou ficam desencontrados)
+    """
+    memory = build_memory(old_file, source_file, log_callback, cache=cache)
+    if memory is None:
+        return False
+    
+    list_file = output_file.replace('.tsv', '_faltando.tsv')
+    return save_suggestions(memory, list_file, log_callback=log_callback)
+
+
+def _source_key(text: str) -> bytes:
+    """Hash do texto original (inglês) usado no índice do merge de três vias"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+
+def merge_tsv_streaming(
+    old_file: str,
+    new_file: str,
+    output_file: str,
+    save_missing: bool = True,
+    write_report: bool = True,
+    log_callback=None,
+    old_original_file: str = None
+) -> dict:
+    """
+    Merge em streaming, sem carregar o original novo em memória
+    
+    Só as traduções antigas ficam em memória (um dict simples). O original
+    novo é lido duas vezes: a primeira guarda só os IDs, para achar os
+    repetidos; na segunda, cada linha vai direto para o TSV mesclado, para
+    a lista de faltantes e para os contadores do relatório.
+    Mesma lógica e mesma saída de merge_translations: um ID repetido sai uma
+    vez, na posição da primeira linha, com o texto da última.
+    
+    Merge de três vias (old_original_file = original da versão traduzida):
+    - guarda o hash do inglês antigo de cada ID e um índice hash → tradução
+    - ID cujo inglês mudou: usa a tradução de um texto idêntico já traduzido,
+      se existir; senão mantém a tradução antiga e lista em _desatualizado.tsv
+    - ID novo ou sem tradução cujo inglês já foi traduzido em outro ID:
+      reaproveita essa tradução em vez de ir para a lista de faltantes
+    - ID cuja "tradução" é o próprio inglês antigo (nome próprio, "OK",
+      número ou string nunca traduzida) fica fora do índice; é preservado
+      enquanto o inglês não mudar, e se mudar recebe o inglês novo e vai
+      para a lista de faltantes (não há tradução a revisar)
+    
+    Returns:
+        dict: estatísticas do merge (vazio em caso de erro)
+    """
+    for filepath in (old_file, new_file, old_original_file):
+        if filepath and not os.path.exists(filepath):
+            if log_callback:
+                log_callback(f"❌ Arquivo não encontrado: {filepath}")
+            return {}
+    
+    try:
+        # Hash do inglês antigo por ID (só no merge de três vias)
+        source_keys = {}
+        if old_original_file:
+            source_keys = {text_id: _source_key(text) for text_id, text in iter_tsv_simple(old_original_file)}
+            if log_callback:
+                log_callback(f"✓ Carregado: {os.path.basename(old_original_file)} ({len(source_keys):,} strings)")
+        
+        # Traduções ainda não usadas; ao aparecer no arquivo novo, a entrada
+        # sai de 'pending' (o que sobrar foi removido)
+        pending = dict(iter_tsv_simple(old_file))
+        if log_callback:
+            log_callback(f"✓ Carregado: {os.path.basename(old_file)} ({len(pending):,} strings)")
+        
+        # IDs repetidos no original novo → texto da última linha (como no OrderedDict)
+        seen = set()
+        repeated = {}
+        for text_id, original_text in iter_tsv_simple(new_file):
+            if text_id in seen:
+                repeated[text_id] = original_text
+            else:
+                seen.add(text_id)
+        del seen
+        
+        # Índice hash do inglês → tradução (primeira tradução de cada texto)
+        # Uma "tradução" igual ao inglês antigo (nome próprio, "OK", número
+        # ou string nunca traduzida) não entra no índice, para não ser
+        # copiada para outros IDs como se fosse tradução
+        source_index = {}
+        verbatim = set()
+        for text_id, translated_text in pending.items():
+            key = source_keys.get(text_id)
+            if key is None or not translated_text.strip():
+                continue
+            if _source_key(translated_text) == key:
+                verbatim.add(text_id)
+            else:
+                source_index.setdefault(key, translated_text)
+        
+        stats = {
+            'total_old': len(pending),
+            'total_new': 0,
+            'preserved': 0,
+            'new_strings': 0,
+            'removed': 0,
+        }
+        if old_original_file:
+            stats['stale'] = 0      # Inglês mudou, tradução antiga mantida
+            stats['carried'] = 0    # Tradução reaproveitada de texto idêntico
+        added_count = 0
+        added = []
+        missing_count = 0
+        written = set()   # IDs repetidos já escritos
+        list_file = output_file.replace('.tsv', '_faltando.tsv')
+        stale_file = output_file.replace('.tsv', '_desatualizado.tsv')
+        
+        with open(output_file, 'w', newline='', encoding='utf-8') as out_f, \
+             open(list_file if save_missing else os.devnull, 'w', newline='', encoding='utf-8') as list_f, \
+             open(stale_file if old_original_file else os.devnull, 'w', newline='', encoding='utf-8') as stale_f:
+            writer = csv.writer(out_f, delimiter='\t')
+            list_writer = csv.writer(list_f, delimiter='\t')
+            stale_writer = csv.writer(stale_f, delimiter='\t')
+            writer.writerow(['ID', 'OriginalText'])
+            list_writer.writerow(['ID', 'OriginalText'])
+            stale_writer.writerow(['ID', 'OriginalText', 'OldTranslation'])
+            
+            for text_id, original_text in iter_tsv_simple(new_file):
+                if text_id in repeated:
+                    if text_id in written:
+                        continue
+                    written.add(text_id)
+                    original_text = repeated[text_id]
+                stats['total_new'] += 1
+                
+                translated_text = pending.pop(text_id, None)
+                if translated_text is None:
+                    # ID novo
+                    added_count += 1
+                    if len(added) < REPORT_SAMPLE:
+                        added.append((text_id, original_text))
+                
+                key = _source_key(original_text) if source_keys else None
+                
+                if translated_text and translated_text.strip():
+                    old_key = source_keys.get(text_id) if source_keys else None
+                    if old_key is None or old_key == key:
+                        writer.writerow([text_id, translated_text])
+                        stats['preserved'] += 1
+                    elif key in source_index:
+                        # Inglês mudou para um texto que já tem tradução
+                        writer.writerow([text_id, source_index[key]])
+                        stats['carried'] += 1
+                    elif text_id in verbatim:
+                        # Inglês mudou e a "tradução" era o inglês antigo -
+                        # usa o inglês novo, sem nada a revisar
+                        writer.writerow([text_id, original_text])
+                        list_writer.writerow([text_id, original_text])
+                        stats['new_strings'] += 1
+                        missing_count += 1
+                    else:
+                        # Inglês mudou - mantém a tradução antiga para revisão
+                        writer.writerow([text_id, translated_text])
+                        stale_writer.writerow([text_id, original_text, translated_text])
+                        stats['stale'] += 1
+                elif key is not None and key in source_index:
+                    # Texto idêntico a outro já traduzido
+                    writer.writerow([text_id, source_index[key]])
+                    stats['carried'] += 1
+                else:
+                    # ID novo, tradução vazia ou nunca traduzida - usa original
+                    writer.writerow([text_id, original_text])
+                    list_writer.writerow([text_id, original_text])
+                    stats['new_strings'] += 1
+                    missing_count += 1
+        
+        if not stats['total_new']:
+            if log_callback:
+                log_callback("❌ Arquivo novo está vazio!")
+            return {}
+        
+        # O que sobrou em 'pending' não existe mais no arquivo novo
+        stats['removed'] = len(pending)
+        del repeated, written, source_keys, source_index, verbatim
+        
+        _log_merge_stats(stats, log_callback)
+        
+        if log_callback:
+            log_callback(f"✅ Arquivo salvo: {output_file}")
+            log_callback(f"   Total: {stats['total_new']:,} strings")
+            if save_missing:
+                log_callback(f"📝 Lista de faltantes: {list_file} ({missing_count:,} strings)")
+            if old_original_file:
+                log_callback(f"🔎 Lista de desatualizadas: {stale_file} ({stats['stale']:,} strings)")
+        
+        if write_report:
+            report_file = output_file.replace('.tsv', '_relatorio.txt')
+            removed = list(islice(pending.items(), REPORT_SAMPLE))
+            _write_report(report_file, stats, added_count, added, stats['removed'], removed)
+            if log_callback:
+                log_callback(f"📄 Relatório: {report_file}")
+        
+        return stats
+        
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro no merge: {str(e)}")
+        return {}
+
+
 # ============================================================================
 # INTERFACE GRÁFICA
 # ============================================================================
@@ -327,8 +586,9 @@ if HAS_GUI:
         log_signal = pyqtSignal(str)
         finished_signal = pyqtSignal(bool, dict)
         
-        def __init__(self, old_file, new_file, output_file, options):
+        def __init__(self, old_file, new_file, output_file, options, old_original_file=None):
             super().__init__()
+            self.old_original_file = old_original_file
             self.old_file = old_file
             self.new_file = new_file
             self.output_file = output_file
@@ -339,6 +599,23 @@ if HAS_GUI:
                 self.log_signal.emit("🔄 Iniciando merge...")
                 self.log_signal.emit("")
                 
+                if self.options.get('stream', False) or self.old_original_file:
+                    stats = merge_tsv_streaming(
+                        self.old_file,
+                        self.new_file,
+                        self.output_file,
+                        save_missing=self.options.get('save_missing', True),
+                        write_report=self.options.get('save_report', True),
+                        log_callback=self.log_signal.emit,
+                        old_original_file=self.old_original_file
+                    )
+                    if not stats:
+                        self.finished_signal.emit(False, {})
+                        return
+                    self._save_suggestions(self.old_original_file or self.new_file)
+                    self._finish(stats)
+                    return
+                
                 # Carrega arquivos
                 old_data = load_tsv_simple(self.old_file, self.log_signal.emit)
                 new_data = load_tsv_simple(self.new_file, self.log_signal.emit)
@@ -366,19 +643,27 @@ if HAS_GUI:
                 if self.options.get('save_report', True):
                     save_report(stats, old_data, new_data, self.output_file, self.log_signal.emit)
                 
-                self.log_signal.emit("")
-                self.log_signal.emit("=" * 50)
-                self.log_signal.emit("✅ MERGE CONCLUÍDO!")
-                self.log_signal.emit("")
-                self.log_signal.emit("⚠️  LEMBRE-SE: Para empacotar, use o arquivo .map")
-                self.log_signal.emit("   do original NOVO, não do antigo!")
-                self.log_signal.emit("=" * 50)
-                
-                self.finished_signal.emit(True, stats)
+                self._save_suggestions(self.new_file)
+                self._finish(stats)
                 
             except Exception as e:
                 self.log_signal.emit(f"❌ Erro: {str(e)}")
                 self.finished_signal.emit(False, {})
+        
+        def _save_suggestions(self, source_file):
+            if self.options.get('save_missing', True) and self.options.get('suggest', False):
+                save_suggestions_list(self.old_file, source_file, self.output_file, self.log_signal.emit)
+        
+        def _finish(self, stats):
+            self.log_signal.emit("")
+            self.log_signal.emit("=" * 50)
+            self.log_signal.emit("✅ MERGE CONCLUÍDO!")
+            self.log_signal.emit("")
+            self.log_signal.emit("⚠️  LEMBRE-SE: Para empacotar, use o arquivo .map")
+            self.log_signal.emit("   do original NOVO, não do antigo!")
+            self.log_signal.emit("=" * 50)
+            
+            self.finished_signal.emit(True, stats)
     
     
     class MergeWindow(QMainWindow):
@@ -440,6 +725,15 @@ if HAS_GUI:
             new_btn.clicked.connect(lambda: self.browse_file(self.new_file_input))
             input_layout.addWidget(new_btn, 1, 2)
             
+            input_layout.addWidget(QLabel("Original Antigo (.tsv):"), 2, 0)
+            self.old_original_input = QLineEdit()
+            self.old_original_input.setPlaceholderText("Opcional: original da versão traduzida (detecta inglês alterado)...")
+            input_layout.addWidget(self.old_original_input, 2, 1)
+            old_original_btn = QPushButton("📁")
+            old_original_btn.setFixedWidth(40)
+            old_original_btn.clicked.connect(lambda: self.browse_file(self.old_original_input))
+            input_layout.addWidget(old_original_btn, 2, 2)
+            
             input_group.setLayout(input_layout)
             layout.addWidget(input_group)
             
@@ -471,6 +765,14 @@ if HAS_GUI:
             self.save_report_cb.setChecked(True)
             options_layout.addWidget(self.save_report_cb)
             
+            self.stream_cb = QCheckBox("Modo streaming (menos memória em arquivos grandes)")
+            self.stream_cb.setChecked(False)
+            options_layout.addWidget(self.stream_cb)
+            
+            self.suggest_cb = QCheckBox("Sugerir traduções para as faltantes pela memória de tradução (_sugestoes.tsv)")
+            self.suggest_cb.setChecked(False)
+            options_layout.addWidget(self.suggest_cb)
+            
             options_group.setLayout(options_layout)
             layout.addWidget(options_group)
             
@@ -576,6 +878,7 @@ if HAS_GUI:
         def start_merge(self):
             old_file = self.old_file_input.text().strip()
             new_file = self.new_file_input.text().strip()
+            old_original_file = self.old_original_input.text().strip() or None
             output_file = self.output_file_input.text().strip()
             
             if not old_file or not new_file:
@@ -591,9 +894,11 @@ if HAS_GUI:
             options = {
                 'save_missing': self.save_missing_cb.isChecked(),
                 'save_report': self.save_report_cb.isChecked(),
+                'stream': self.stream_cb.isChecked(),
+                'suggest': self.suggest_cb.isChecked(),
             }
             
-            self.merge_thread = MergeThread(old_file, new_file, output_file, options)
+            self.merge_thread = MergeThread(old_file, new_file, output_file, options, old_original_file)
             self.merge_thread.log_signal.connect(self.log)
             self.merge_thread.finished_signal.connect(self.on_finished)
             self.merge_thread.start()
@@ -602,12 +907,17 @@ if HAS_GUI:
             self.merge_btn.setEnabled(True)
             
             if success:
+                three_way = ""
+                if 'stale' in stats:
+                    three_way = (f"🔁 Reaproveitadas: {stats['carried']:,}\n"
+                                 f"🔎 Inglês alterado: {stats['stale']:,}\n")
                 QMessageBox.information(
                     self, "Sucesso",
                     f"Merge concluído!\n\n"
                     f"✅ Traduções preservadas: {stats.get('preserved', 0):,}\n"
                     f"🆕 Strings a traduzir: {stats.get('new_strings', 0):,}\n"
-                    f"🗑️ Removidas: {stats.get('removed', 0):,}\n\n"
+                    f"🗑️ Removidas: {stats.get('removed', 0):,}\n"
+                    f"{three_way}\n"
                     f"⚠️ Use o .map do original NOVO para empacotar!"
                 )
 
@@ -623,6 +933,9 @@ def main_cli():
         epilog="""
 Exemplo:
   python wwm_merge_tsv.py --old traducao.tsv --new original_novo.tsv --output mesclado.tsv
+  python wwm_merge_tsv.py --old traducao.tsv --new original_novo.tsv --output mesclado.tsv --stream
+  python wwm_merge_tsv.py --old traducao.tsv --old-original original_antigo.tsv --new original_novo.tsv
+  python wwm_merge_tsv.py --old traducao.tsv --old-original original_antigo.tsv --new original_novo.tsv --suggest
 
 IMPORTANTE: Para empacotar o resultado, use o arquivo .map do NOVO, não do antigo!
         """
@@ -632,6 +945,14 @@ IMPORTANTE: Para empacotar o resultado, use o arquivo .map do NOVO, não do anti
     parser.add_argument('--new', '-n', required=True, help='TSV original do jogo atualizado')
     parser.add_argument('--output', '-out', default='translation_merged.tsv', help='Arquivo de saída')
     parser.add_argument('--no-report', action='store_true', help='Não gerar relatório')
+    parser.add_argument('--stream', action='store_true',
+                        help='Merge em streaming: só as traduções antigas ficam em memória')
+    parser.add_argument('--old-original', '-oo',
+                        help='TSV original da versão traduzida (merge de três vias, detecta inglês alterado)')
+    parser.add_argument('--suggest', action='store_true',
+                        help='Anotar as faltantes com sugestões da memória de tradução (_sugestoes.tsv)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Guardar/reaproveitar snapshots dos TSVs (.wwm_cache ao lado de cada TSV)')
     parser.add_argument('--gui', action='store_true', help='Abrir interface gráfica')
     
     args = parser.parse_args()
@@ -645,8 +966,20 @@ IMPORTANTE: Para empacotar o resultado, use o arquivo .map do NOVO, não do anti
     print(f"\n⚔️ {APP_NAME} v{APP_VERSION}")
     print("=" * 50)
     
-    old_data = load_tsv_simple(args.old, print)
-    new_data = load_tsv_simple(args.new, print)
+    if args.stream or args.old_original:
+        if not merge_tsv_streaming(args.old, args.new, args.output,
+                                   write_report=not args.no_report, log_callback=print,
+                                   old_original_file=args.old_original):
+            sys.exit(1)
+        if args.suggest and not save_suggestions_list(args.old, args.old_original or args.new, args.output, print,
+                                                     cache=args.cache):
+            sys.exit(1)
+        print("\n✅ Processo concluído!")
+        print("\n⚠️  IMPORTANTE: Para empacotar, use o arquivo .map do NOVO!")
+        return
+    
+    old_data = load_tsv_simple(args.old, print, cache=args.cache)
+    new_data = load_tsv_simple(args.new, print, cache=args.cache)
     
     if not new_data:
         print("❌ Arquivo novo está vazio!")
@@ -660,6 +993,9 @@ IMPORTANTE: Para empacotar o resultado, use o arquivo .map do NOVO, não do anti
     if not args.no_report:
         save_report(stats, old_data, new_data, args.output, print)
     
+    if args.suggest and not save_suggestions_list(args.old, args.new, args.output, print, cache=args.cache):
+        sys.exit(1)
+    
     print("\n✅ Processo concluído!")
     print("\n⚠️  IMPORTANTE: Para empacotar, use o arquivo .map do NOVO!")
 
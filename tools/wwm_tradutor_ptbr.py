@@ -14,7 +14,14 @@ import os
 import sys
 import struct
 import csv
+import json
+import queue
+import shutil
+import hashlib
 import configparser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
@@ -24,6 +31,14 @@ except ImportError:
     print("Erro: pyzstd não encontrado. Instale com: pip install pyzstd")
     sys.exit(1)
 
+from wwm_container import (
+    GAME_FILE_SIGNATURE, TEXT_BLOCK_SIGNATURE, BLOCK_HEADER_SIZE, COMP_TYPE_ZSTD, ContainerReader, BlockCache,
+    MapFile, BinaryMap, BinaryMapWriter, build_id_index, read_tsv_map, is_text_block, parse_text_block, build_text_block,
+    escape_text, unescape_text, raw_text_marker
+)
+from wwm_tsv import load_tsv
+from wwm_layout import TRANSLATION_STRUCTURE
+
 try:
     from PyQt5.QtWidgets import (
         QApplication, QMainWindow, QWidget, QPushButton, QTextEdit, 
@@ -46,9 +61,15 @@ APP_NAME = "WWM Tradutor PT-BR"
 APP_VERSION = "2.1.0"
 CONFIG_FILE = "config_ptbr.ini"
 
-GAME_FILE_SIGNATURE = b'\xEF\xBE\xAD\xDE'
-TEXT_BLOCK_SIGNATURE = b'\xDC\x96\x58\x59'
 OUTPUT_FOLDER = "output"
+DEFAULT_WORKERS = os.cpu_count() or 1
+DEFAULT_COMPRESSION_LEVEL = 3  # Nível padrão do zstd (mesmo do pyzstd.compress)
+
+BATCH_MANIFEST = "batch.json"
+TEXT_PACK_MANIFEST = "text_pack.json"  # Hash das entradas de cada .dat de texto reconstruído
+TEXT_FRAME_MANIFEST = "text_frames.json"  # Hash das entradas de cada bloco de texto → frame no BlockCache
+BLOCK_MANIFEST = "blocks.json"  # Blocos do container original e os não extraídos (na pasta dos .dat)
+BLOCK_MANIFEST_EXT = ".blocks.json"  # O mesmo registro ao lado do TSV (nome.blocks.json)
 
 
 # ============================================================================
@@ -91,42 +112,106 @@ def list_existing_sessions() -> list:
     return sorted(sessions, reverse=True)  # Mais recente primeiro
 
 
-def extract_game_file(input_file: str, output_dir: str, log_callback=None) -> bool:
+def _ordered_map(func, items, workers: int = 1, pool: ThreadPoolExecutor = None):
+    """
+    Equivalente a map(func, items) executado em um pool de threads
+    Os resultados saem na ordem dos itens e no máximo 2 * workers tarefas
+    ficam pendentes (limita a memória com blocos grandes)
+    pool permite compartilhar um mesmo executor entre várias chamadas
+    """
+    if pool is None:
+        if workers <= 1:
+            yield from map(func, items)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as own_pool:
+            yield from _ordered_map(func, items, workers, own_pool)
+        return
+    
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(func, item))
+        if len(pending) >= max(1, workers) * 2:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _extract_block(reader: ContainerReader, index: int, output_path: str = None,
+                   cache: BlockCache = None, text_only: bool = False):
+    """
+    Descompacta um bloco do container e, se output_path for informado,
+    grava o .dat correspondente
+    Com cache, guarda também o frame original indexado pelo hash do .dat
+    Com text_only, blocos que não são de texto são descartados após
+    descompactar apenas o cabeçalho
+    
+    Retorna: dados descompactados ou None se o bloco for inválido/ignorado
+    """
+    if text_only and not reader.is_text_block(index):
+        return None
+    
+    try:
+        decomp_data = reader.read_block(index)
+    except pyzstd.ZstdError:
+        return None
+    
+    if decomp_data is None:
+        return None
+    
+    if output_path:
+        with open(output_path, 'wb') as out_f:
+            out_f.write(decomp_data)
+    
+    if cache is not None:
+        with reader.raw_block(index) as block, block[BLOCK_HEADER_SIZE:] as frame:
+            cache.put(cache.key(decomp_data), frame, original=True)
+    return decomp_data
+
+
+def extract_game_file(input_file: str, output_dir: str, log_callback=None, workers: int = 1,
+                      cache_dir: str = None, text_only: bool = False) -> bool:
     """
     Extrai um arquivo binário do jogo para múltiplos arquivos .dat
     Suporta arquivos normais e arquivos _diff
+    O container é lido via mmap (ContainerReader), sem cópias dos blocos
+    
+    workers > 1 descompacta e grava os blocos em paralelo (threads);
+    os nomes _{i}.dat e a ordem do log são os mesmos da extração serial
+    
+    cache_dir alimenta o BlockCache da sessão com os frames originais,
+    usado pelo empacotamento incremental (pack_game_file)
+    
+    text_only extrai só os blocos de texto: os demais são identificados
+    descompactando apenas os primeiros bytes e não são gravados
     """
     try:
         base_name = os.path.splitext(os.path.basename(input_file))[0]
         
-        with open(input_file, 'rb') as f:
-            # Verifica assinatura do arquivo
-            if f.read(4) != GAME_FILE_SIGNATURE:
-                if log_callback:
-                    log_callback(f"❌ Arquivo inválido: assinatura não reconhecida")
-                return False
-            
-            f.read(4)  # Pula 4 bytes
-            offset_count = struct.unpack('<I', f.read(4))[0] + 1
-            
-            if offset_count == 1:
+        try:
+            reader = ContainerReader(input_file)
+        except ValueError as e:
+            if log_callback:
+                log_callback(f"❌ Arquivo inválido: {e}")
+            return False
+        
+        skipped = []   # Blocos vazios ou não zstd (sem .dat, como em arquivos _diff)
+        
+        with reader, (BlockCache(cache_dir) if cache_dir else nullcontext()) as cache:
+            if reader.offset_count == 1:
                 # Arquivo com bloco único
-                comp_block_len = struct.unpack('<I', f.read(4))[0]
-                comp_block = f.read(comp_block_len)
-                
-                if len(comp_block) < 9:
+                header = reader.block_header(0)
+                if header is None:
                     return False
                 
-                header = comp_block[:9]
-                comp_data = comp_block[9:]
-                comp_type, comp_size, decomp_size = struct.unpack('<BII', header)
+                comp_type, comp_size, decomp_size = header
                 
                 if comp_type == 0x04:
                     try:
-                        decomp_data = pyzstd.decompress(comp_data)
                         output_path = os.path.join(output_dir, f"{base_name}_0.dat")
-                        with open(output_path, 'wb') as out_f:
-                            out_f.write(decomp_data)
+                        if _extract_block(reader, 0, output_path, cache, text_only) is None:
+                            if text_only:
+                                return True
+                            raise ValueError("bloco inválido")
                         if log_callback:
                             log_callback(f"✅ {base_name}_0.dat ({decomp_size} bytes)")
                     except Exception as e:
@@ -135,51 +220,26 @@ def extract_game_file(input_file: str, output_dir: str, log_callback=None) -> bo
                         return False
             else:
                 # Arquivo com múltiplos blocos
-                offsets = [struct.unpack('<I', f.read(4))[0] for _ in range(offset_count)]
-                data_start = f.tell()
+                indices = range(len(reader))
+                output_paths = [os.path.join(output_dir, f"{base_name}_{i}.dat") for i in indices]
                 
-                # Calcula o tamanho total dos dados disponíveis
-                file_size = os.path.getsize(input_file)
-                data_available = file_size - data_start
+                def extract_one(i):
+                    return i, _extract_block(reader, i, output_paths[i], cache, text_only) is not None
                 
                 extracted_count = 0
-                for i in range(offset_count - 1):
-                    current_offset = offsets[i]
-                    next_offset = offsets[i + 1]
-                    block_len = next_offset - current_offset
-                    
-                    # Verifica se block_len é válido (proteção para arquivos _diff)
-                    if block_len <= 0:
-                        # Tenta calcular o tamanho restante
-                        block_len = data_available - current_offset
-                        if block_len <= 0:
-                            continue
-                    
-                    f.seek(data_start + current_offset)
-                    comp_block = f.read(block_len)
-                    
-                    if len(comp_block) < 9:
+                for i, extracted in _ordered_map(extract_one, indices, workers):
+                    if not extracted:
+                        if not text_only or _skipped_block(reader, i):
+                            skipped.append(i)
                         continue
-                    
-                    header = comp_block[:9]
-                    comp_data = comp_block[9:]
-                    comp_type, comp_size, decomp_size = struct.unpack('<BII', header)
-                    
-                    if comp_type == 0x04:
-                        try:
-                            decomp_data = pyzstd.decompress(comp_data)
-                            output_path = os.path.join(output_dir, f"{base_name}_{i}.dat")
-                            with open(output_path, 'wb') as out_f:
-                                out_f.write(decomp_data)
-                            extracted_count += 1
-                            if log_callback and extracted_count % 100 == 0:
-                                log_callback(f"📦 Extraídos {extracted_count} arquivos...")
-                        except Exception:
-                            pass
+                    extracted_count += 1
+                    if log_callback and extracted_count % 100 == 0:
+                        log_callback(f"📦 Extraídos {extracted_count} arquivos...")
                 
                 if log_callback:
                     log_callback(f"✅ Extração completa: {extracted_count} arquivos .dat")
             
+            _save_block_count(os.path.join(output_dir, BLOCK_MANIFEST), base_name, len(reader), skipped)
             return True
     
     except Exception as e:
@@ -188,30 +248,81 @@ def extract_game_file(input_file: str, output_dir: str, log_callback=None) -> bo
         return False
 
 
-def extract_texts_to_tsv(input_dir: str, output_file: str, log_callback=None) -> bool:
+def _text_writers(out_f, map_f) -> tuple:
+    """Cria os writers do TSV e do .map já com os cabeçalhos"""
+    # TSV simples: apenas ID e OriginalText
+    writer = csv.writer(out_f, delimiter='\t')
+    writer.writerow(['ID', 'OriginalText'])
+    
+    # Mapeamento interno completo (igual ao CSV russo)
+    # File, AllBlocks, WorkBlocks, Block, Unknown, ID
+    map_writer = csv.writer(map_f, delimiter='\t')
+    map_writer.writerow(['File', 'AllBlocks', 'WorkBlocks', 'Block', 'Unknown', 'ID'])
+    
+    return writer, map_writer
+
+
+def _tsv_text(text_bytes, raw: bool = False) -> str:
+    """Texto de uma entrada como é escrito no TSV"""
+    if raw:
+        return escape_text(text_bytes)
+    text = text_bytes.decode('utf-8', errors='ignore')
+    return text.replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _write_text_rows(filename: str, data, writer, map_writer, binary_map: BinaryMapWriter = None,
+                     raw: bool = False) -> int:
+    """
+    Escreve as strings de um bloco de texto no TSV e no .map (e no .bmap, se informado)
+    Com raw, os textos são escritos com escape_text (sem perdas)
+    Retorna a quantidade de strings escritas
+    """
+    count_full, count_text, unknown_codes, entries = parse_text_block(data)
+    if binary_map is not None:
+        binary_map.add_file(filename, count_full, count_text, range(len(entries)),
+                            unknown_codes, [id_bytes for id_bytes, _ in entries])
+    # Bytes "unknown" (códigos) - importante para reconstruir!
+    unknown_codes = unknown_codes.hex()
+    
+    for i, (id_bytes, text_bytes) in enumerate(entries):
+        text_id = id_bytes.hex()
+        text = _tsv_text(text_bytes, raw)
+        
+        # Código unknown deste bloco (2 caracteres hex por bloco)
+        unknown_byte = unknown_codes[i*2:(i+1)*2]
+        
+        # Escreve no TSV simples
+        writer.writerow([text_id, text])
+        # Escreve no mapeamento completo
+        map_writer.writerow([filename, str(count_full), str(count_text), str(i), unknown_byte, text_id])
+    
+    return len(entries)
+
+
+def extract_texts_to_tsv(input_dir: str, output_file: str, log_callback=None, raw: bool = False) -> bool:
     """
     Extrai textos dos arquivos .dat para um arquivo TSV
     Formato: ID + OriginalText (igual ao translation_en.tsv)
-    O mapeamento interno completo é salvo em arquivo separado (.map) com todos os dados necessários
+    O mapeamento interno completo é salvo em arquivo separado (.map) com todos os dados necessários,
+    junto com a versão binária (.bmap) e o índice ordenado de IDs (.idx)
+    
+    raw grava os textos em modo bruto (escape_text, sem perdas) e cria o
+    marcador .raw ao lado do TSV, usado pelo empacotamento
     """
     try:
         text_files_count = 0
         total_strings = 0
         
-        # Arquivo de mapeamento (interno, para empacotar de volta)
+        # Arquivo de mapeamento (interno, para empacotar de volta) e sua versão binária
+        # (o .bmap é gravado por último, depois que o .map é fechado)
         map_file = output_file.replace('.tsv', '.map')
+        bmap_file = output_file.replace('.tsv', '.bmap')
         
-        with open(output_file, 'w', newline='', encoding='utf-8') as out_f, \
+        with BinaryMapWriter(bmap_file) as binary_map, \
+             open(output_file, 'w', newline='', encoding='utf-8') as out_f, \
              open(map_file, 'w', newline='', encoding='utf-8') as map_f:
             
-            # TSV simples: apenas ID e OriginalText
-            writer = csv.writer(out_f, delimiter='\t')
-            writer.writerow(['ID', 'OriginalText'])
-            
-            # Mapeamento interno completo (igual ao CSV russo)
-            # File, AllBlocks, WorkBlocks, Block, Unknown, ID
-            map_writer = csv.writer(map_f, delimiter='\t')
-            map_writer.writerow(['File', 'AllBlocks', 'WorkBlocks', 'Block', 'Unknown', 'ID'])
+            writer, map_writer = _text_writers(out_f, map_f)
             
             dat_files = sorted([f for f in os.listdir(input_dir) if f.endswith('.dat')])
             
@@ -225,39 +336,19 @@ def extract_texts_to_tsv(input_dir: str, output_file: str, log_callback=None) ->
                     
                     text_files_count += 1
                     f.seek(0)
-                    
-                    count_full = struct.unpack('<I', f.read(4))[0]
-                    f.read(4)
-                    count_text = struct.unpack('<I', f.read(4))[0]
-                    f.read(12)
-                    # Lê os bytes "unknown" (códigos) - importante para reconstruir!
-                    unknown_codes = f.read(count_full).hex()
-                    f.read(17)
-                    data_start = f.tell()
-                    
-                    for i in range(count_full):
-                        f.seek(data_start + (i * 16))
-                        text_id = f.read(8).hex()
-                        start_text_offset = f.tell()
-                        offset_text = struct.unpack('<I', f.read(4))[0]
-                        length = struct.unpack('<I', f.read(4))[0]
-                        
-                        f.seek(start_text_offset + offset_text)
-                        text = f.read(length).decode('utf-8', errors='ignore')
-                        text = text.replace('\n', '\\n').replace('\r', '\\r')
-                        
-                        # Código unknown deste bloco (2 caracteres hex por bloco)
-                        unknown_byte = unknown_codes[i*2:(i+1)*2]
-                        
-                        # Escreve no TSV simples
-                        writer.writerow([text_id, text])
-                        # Escreve no mapeamento completo
-                        map_writer.writerow([filename, str(count_full), str(count_text), str(i), unknown_byte, text_id])
-                        total_strings += 1
+                    data = f.read()
+                
+                total_strings += _write_text_rows(filename, data, writer, map_writer, binary_map, raw)
                 
                 if log_callback and text_files_count % 10 == 0:
                     log_callback(f"📝 Processados {text_files_count} arquivos de texto...")
         
+        # Índice ID → (.dat, bloco) ordenado, para consultas sem ler o mapeamento
+        if not build_id_index(bmap_file, output_file.replace('.tsv', '.idx'), log_callback):
+            return False
+        
+        _mark_raw_text(output_file, raw)
+        
         if log_callback:
             log_callback(f"✅ Extração completa: {total_strings} strings de {text_files_count} arquivos")
             log_callback(f"📄 TSV para tradução: {os.path.basename(output_file)}")
@@ -270,45 +361,275 @@ def extract_texts_to_tsv(input_dir: str, output_file: str, log_callback=None) ->
         return False
 
 
-def pack_game_file(input_dir: str, output_file: str, log_callback=None) -> bool:
+def extract_game_texts(input_file: str, output_file: str, log_callback=None, workers: int = 1,
+                       dat_dir: str = None, cache_dir: str = None,
+                       pool: ThreadPoolExecutor = None, raw: bool = False) -> bool:
     """
-    Empacota arquivos .dat de volta para o formato do jogo
+    Extração direta .bin → .tsv/.map, sem passar pelos arquivos .dat
+    Cada bloco é descompactado, testado (TEXT_BLOCK_SIGNATURE) e decodificado em memória
+    Produz o mesmo TSV/.map que extract_game_file + extract_texts_to_tsv
+    
+    dat_dir (opcional) grava também os .dat, para depuração ou empacotamento
+    workers e cache_dir funcionam como em extract_game_file
+    
+    Sem dat_dir e sem cache_dir, os blocos que não são de texto são
+    descartados após descompactar apenas o cabeçalho
+    
+    pool (opcional) é um executor compartilhado com outras extrações (lote)
+    raw funciona como em extract_texts_to_tsv
     """
     try:
-        files = [f for f in os.listdir(input_dir) if f.endswith('.dat')]
+        base_name = os.path.splitext(os.path.basename(input_file))[0]
+        
+        try:
+            reader = ContainerReader(input_file)
+        except ValueError as e:
+            if log_callback:
+                log_callback(f"❌ Arquivo inválido: {e}")
+            return False
+        
+        text_files_count = 0
+        total_strings = 0
+        skipped = []   # Blocos vazios ou não zstd (sem .dat, como em arquivos _diff)
+        
+        # Arquivo de mapeamento (interno, para empacotar de volta) e sua versão binária
+        # (o .bmap é gravado por último, depois que o .map é fechado)
+        map_file = output_file.replace('.tsv', '.map')
+        bmap_file = output_file.replace('.tsv', '.bmap')
         
-        def extract_number(filename):
-            match = re.search(r'(\d+)\.dat$', filename)
-            return int(match.group(1)) if match else float('inf')
+        with reader, (BlockCache(cache_dir) if cache_dir else nullcontext()) as cache, \
+             BinaryMapWriter(bmap_file) as binary_map, \
+             open(output_file, 'w', newline='', encoding='utf-8') as out_f, \
+             open(map_file, 'w', newline='', encoding='utf-8') as map_f:
+            
+            writer, map_writer = _text_writers(out_f, map_f)
+            
+            # Mesma ordem de extract_texts_to_tsv (nomes dos .dat em ordem alfabética)
+            block_count = len(reader)
+            indices = sorted(range(block_count), key=lambda i: f"{base_name}_{i}.dat")
+            
+            # Todos os blocos precisam ser lidos por inteiro só para gravar .dat ou o cache
+            text_only = not dat_dir and cache is None
+            
+            def read_one(i):
+                output_path = os.path.join(dat_dir, f"{base_name}_{i}.dat") if dat_dir else None
+                data = _extract_block(reader, i, output_path, cache, text_only)
+                if data is None:
+                    return i, None, not text_only or _skipped_block(reader, i)
+                return i, (data if is_text_block(data) else None), False
+            
+            for i, data, invalid in _ordered_map(read_one, indices, workers, pool):
+                if invalid:
+                    skipped.append(i)
+                if data is None:
+                    continue
+                
+                text_files_count += 1
+                total_strings += _write_text_rows(f"{base_name}_{i}.dat", data, writer, map_writer,
+                                                  binary_map, raw)
+                
+                if log_callback and text_files_count % 10 == 0:
+                    log_callback(f"📝 Processados {text_files_count} arquivos de texto...")
+        
+        # Índice ID → (.dat, bloco) ordenado, para consultas sem ler o mapeamento
+        if not build_id_index(bmap_file, output_file.replace('.tsv', '.idx'), log_callback):
+            return False
+        
+        _mark_raw_text(output_file, raw)
+        _save_block_count(output_file.replace('.tsv', BLOCK_MANIFEST_EXT), base_name, block_count, skipped)
+        if dat_dir:
+            _save_block_count(os.path.join(dat_dir, BLOCK_MANIFEST), base_name, block_count, skipped)
+        
+        if log_callback:
+            log_callback(f"✅ Extração completa: {total_strings} strings de {text_files_count} arquivos")
+            log_callback(f"📄 TSV para tradução: {os.path.basename(output_file)}")
+            log_callback(f"📄 Mapeamento interno: {os.path.basename(map_file)}")
+        return True
+    
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro na extração de textos: {str(e)}")
+        return False
+
+
+def _mark_raw_text(tsv_file: str, raw: bool):
+    """Cria (ou remove) o marcador de modo bruto do TSV"""
+    marker = raw_text_marker(tsv_file)
+    if raw:
+        with open(marker, 'w', encoding='utf-8') as f:
+            f.write("Textos em modo bruto (escape_text/unescape_text)\n")
+    elif os.path.exists(marker):
+        os.remove(marker)
+
+
+def _compress_dat(file_path: str, level: int, cache: BlockCache = None) -> tuple:
+    """
+    Lê um .dat e retorna (dados compactados, tamanho original, veio do cache)
+    Com cache, blocos cujo conteúdo não mudou reaproveitam o frame já compactado
+    """
+    with open(file_path, 'rb') as infile:
+        data = infile.read()
+    return _compress_block(data, level, cache)
+
+
+def _compress_block(data, level: int, cache: BlockCache = None, key: str = None) -> tuple:
+    """
+    Mesmo retorno de _compress_dat, para um bloco já em memória
+    key: hash do bloco (BlockCache.key), se já calculado
+    """
+    if cache is None:
+        return pyzstd.compress(data, level), len(data), False
+    
+    if key is None:
+        key = cache.key(data)
+    comp_data = cache.get(key)
+    if comp_data is not None:
+        return comp_data, len(data), True
+    
+    comp_data = pyzstd.compress(data, level)
+    cache.put(key, comp_data)
+    return comp_data, len(data), False
+
+
+def _dat_number(filename: str):
+    """Índice do bloco no nome do .dat (nome_{i}.dat) ou None se o nome não tiver índice"""
+    match = re.search(r'(\d+)\.dat$', filename)
+    return int(match.group(1)) if match else None
+
+
+def _skipped_block(reader: ContainerReader, index: int) -> bool:
+    """Bloco vazio ou não zstd, que a extração não grava como .dat"""
+    header = reader.block_header(index)
+    return header is None or header.comp_type != COMP_TYPE_ZSTD
+
+
+def _save_block_count(path: str, base_name: str, block_count: int, skipped: list = ()):
+    """
+    Registra a quantidade de blocos do container original e os índices
+    sem .dat (blocos vazios ou não zstd) em BLOCK_MANIFEST
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'file': base_name, 'blocks': block_count, 'skipped': sorted(skipped)}, f)
+
+
+def _load_block_count(*paths):
+    """
+    Registro da extração (primeiro encontrado): (quantidade de blocos,
+    índices sem .dat) ou None
+    """
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            return record['blocks'], record.get('skipped', [])
+    return None
+
+
+def _check_blocks(files: list, block_count, log_callback=None) -> bool:
+    """
+    Confere se há exatamente um .dat (ou bloco de texto reconstruído) para
+    cada índice 0..N-1 do container original, exceto os blocos que a
+    extração não gravou; files ordenados por _dat_number
+    block_count: (N, índices sem .dat) de _load_block_count
+    None (sessão sem o registro da extração): N = maior índice + 1
+    """
+    numbers = [_dat_number(f) for f in files]
+    if block_count is None:
+        block_count = (numbers[-1] + 1, [])
+    total, skipped = block_count
+    skipped = set(skipped)
+    expected = [i for i in range(total) if i not in skipped]
+    if numbers == expected:
+        return True
+    
+    if log_callback:
+        missing = sorted(set(expected) - set(numbers))
+        if len(set(numbers)) < len(numbers) or not missing:
+            log_callback(f"❌ Arquivos .dat além dos {len(expected)} blocos extraídos do container original "
+                         f"(índice repetido, fora de nome_0.dat..nome_{total - 1}.dat ou de bloco não extraído)")
+        else:
+            log_callback(f"❌ Faltam {len(missing)} de {len(expected)} blocos extraídos do container original "
+                         f"(primeiro: índice {missing[0]})")
+            log_callback("💡 Extrações só de texto não servem para empacotar: extraia de novo com todos os blocos")
+    return False
+
+
+def _write_game_file(output_file: str, compressed, count: int, log_callback=None) -> int:
+    """
+    Grava o container a partir de (dados compactados, tamanho original, veio do cache)
+    de cada bloco, na ordem. A tabela de offsets é reservada no início e
+    preenchida ao final. Retorna quantos blocos vieram do cache
+    """
+    with open(output_file, 'wb') as outfile:
+        # Escreve cabeçalho
+        outfile.write(GAME_FILE_SIGNATURE + b'\x01\x00\x00\x00')
+        outfile.write(struct.pack('<I', count))
+        
+        # Reserva a tabela de offsets (preenchida no final)
+        table_pos = outfile.tell()
+        outfile.write(b'\x00' * (4 * (count + 1)))
+        
+        offsets = []
+        data_len = 0
+        reused = 0
+        for i, (comp_data, decomp_size, from_cache) in enumerate(compressed):
+            reused += from_cache
+            offsets.append(data_len)
+            outfile.write(struct.pack('<BII', 4, len(comp_data), decomp_size))
+            outfile.write(comp_data)
+            data_len += BLOCK_HEADER_SIZE + len(comp_data)
+            
+            if log_callback and (i + 1) % 100 == 0:
+                log_callback(f"📦 Empacotados {i + 1}/{count} arquivos...")
         
-        files.sort(key=extract_number)
+        offsets.append(data_len)
+        outfile.seek(table_pos)
+        outfile.write(struct.pack(f'<{len(offsets)}I', *offsets))
+    
+    return reused
+
+
+def pack_game_file(input_dir: str, output_file: str, log_callback=None,
+                   workers: int = 1, level: int = DEFAULT_COMPRESSION_LEVEL,
+                   cache_dir: str = None) -> bool:
+    """
+    Empacota arquivos .dat de volta para o formato do jogo
+    Cada bloco compactado é gravado direto no arquivo de saída; a tabela de
+    offsets é reservada no início e preenchida ao final (um bloco por vez em memória)
+    
+    workers > 1 compacta os blocos em paralelo; a gravação segue a ordem
+    dos índices, então o resultado é idêntico byte a byte ao modo serial
+    
+    cache_dir ativa o empacotamento incremental: só os .dat alterados desde a
+    extração (ou o último empacotamento) são recompactados; os frames do
+    cache são copiados como estão, sem levar em conta level
+    
+    A pasta precisa ter um .dat para cada bloco do container original,
+    exceto os vazios ou não zstd (registrados em BLOCK_MANIFEST na extração)
+    """
+    try:
+        # .dat sem índice no nome (nome_{i}.dat) não fazem parte do container
+        files = [f for f in os.listdir(input_dir) if f.endswith('.dat') and _dat_number(f) is not None]
+        files.sort(key=_dat_number)
         
         if not files:
             if log_callback:
                 log_callback("❌ Nenhum arquivo .dat encontrado na pasta")
             return False
         
-        with open(output_file, 'wb') as outfile:
-            # Escreve cabeçalho
-            outfile.write(GAME_FILE_SIGNATURE + b'\x01\x00\x00\x00')
-            outfile.write(struct.pack('<I', len(files)))
+        if not _check_blocks(files, _load_block_count(os.path.join(input_dir, BLOCK_MANIFEST)), log_callback):
+            return False
+        
+        with (BlockCache(cache_dir) if cache_dir else nullcontext()) as cache:
+            def compress_one(filename):
+                return _compress_dat(os.path.join(input_dir, filename), level, cache)
             
-            archive = b''
-            for i, filename in enumerate(files):
-                file_path = os.path.join(input_dir, filename)
-                file_size = os.path.getsize(file_path)
-                
-                with open(file_path, 'rb') as infile:
-                    comp_data = pyzstd.compress(infile.read())
-                    header = struct.pack('<BII', 4, len(comp_data), file_size)
-                    outfile.write(struct.pack('<I', len(archive)))
-                    archive += header + comp_data
-                
-                if log_callback and (i + 1) % 100 == 0:
-                    log_callback(f"📦 Empacotados {i + 1}/{len(files)} arquivos...")
+            compressed = _ordered_map(compress_one, files, workers)
+            reused = _write_game_file(output_file, compressed, len(files), log_callback)
             
-            outfile.write(struct.pack('<I', len(archive)))
-            outfile.write(archive)
+            if cache is not None and log_callback:
+                log_callback(f"♻️ Reaproveitados {reused} blocos do cache, "
+                             f"{len(files) - reused} recompactados")
         
         if log_callback:
             log_callback(f"✅ Empacotamento completo: {output_file}")
@@ -320,148 +641,553 @@ def pack_game_file(input_dir: str, output_file: str, log_callback=None) -> bool:
         return False
 
 
-def pack_texts_to_dat(tsv_file: str, dat_dir: str, log_callback=None) -> bool:
+def _text_dat_parts(task: tuple) -> list:
+    """
+    Monta o conteúdo de um .dat de texto a partir de uma tarefa
+    task: (output_path, all_blocks, work_blocks, unknown_codes, ids, texts, raw), com
+    um byte de unknown, um ID de 8 bytes (concatenados) e um texto do TSV
+    por entrada, já na ordem dos blocos; raw indica textos em modo bruto
+    Retorna a lista de partes de build_text_block
+    """
+    _, all_blocks, work_blocks, unknown_codes, ids, texts, raw = task
+    
+    if raw:
+        encoded = [unescape_text(text) for text in texts]
+    else:
+        encoded = [text.replace('\\n', '\n').replace('\\r', '\r').encode('utf-8') for text in texts]
+    
+    # Constrói o arquivo .dat do zero (igual ao script russo pak_text)
+    block_entries = [
+        (unknown_codes[i:i+1], ids[i*8:(i+1)*8], text)
+        for i, text in enumerate(encoded)
+    ]
+    return build_text_block(all_blocks, work_blocks, block_entries)
+
+
+def _write_text_dat(task: tuple) -> str:
+    """
+    Reconstrói um arquivo .dat de texto (usado também nos processos do pool)
+    task: mesma estrutura de _text_dat_parts
+    """
+    output_path = task[0]
+    
+    # Escreve arquivo completo
+    with open(output_path, 'wb') as f:
+        f.writelines(_text_dat_parts(task))
+    return output_path
+
+
+def _map_task(entries, dat_dir: str, translations: dict, raw: bool = False) -> tuple:
+    """
+    Monta a tarefa de _write_text_dat de um arquivo do mapeamento (MapFile do
+    .bmap ou MapEntries do .map), com o texto de cada ID resolvido no TSV
+    As entradas continuam em colunas (bytes), sem um objeto por string
+    """
+    blocks = entries.blocks
+    unknown_codes = bytes(entries.unknown_codes)
+    ids = bytes(entries.ids)
+    
+    # A extração grava as entradas em ordem de bloco; só reordena se preciso
+    if any(blocks[i] > blocks[i + 1] for i in range(len(blocks) - 1)):
+        order = sorted(range(len(blocks)), key=blocks.__getitem__)
+        unknown_codes = bytes(unknown_codes[i] for i in order)
+        ids = b''.join(ids[i*8:(i+1)*8] for i in order)
+    
+    # Pega texto traduzido (ou vazio) pelo ID em hex, como no TSV
+    ids_hex = ids.hex()
+    texts = [translations.get(ids_hex[i*16:(i+1)*16], '') for i in range(len(blocks))]
+    
+    return (
+        os.path.join(dat_dir, entries.filename),
+        entries.all_blocks,
+        entries.work_blocks,
+        unknown_codes,
+        ids,
+        texts,
+        raw,
+    )
+
+
+def _tsv_map_tasks(map_file: str, dat_dir: str, translations: dict, raw: bool = False) -> list:
+    """Monta as tarefas de _write_text_dat a partir do .map em TSV"""
+    return [_map_task(entries, dat_dir, translations, raw) for entries in read_tsv_map(map_file)]
+
+
+def _binary_map_tasks(bmap_file: str, dat_dir: str, translations: dict, raw: bool = False) -> list:
+    """Monta as tarefas de _write_text_dat a partir do .bmap"""
+    with BinaryMap(bmap_file) as bmap:
+        return [_map_task(entries, dat_dir, translations, raw) for entries in bmap]
+
+
+def _text_task_digest(task: tuple) -> str:
+    """
+    Hash das entradas de uma tarefa de _write_text_dat (cabeçalho e, na ordem
+    dos blocos, unknown/ID/texto), usado para pular arquivos sem alterações
+    """
+    _, all_blocks, work_blocks, unknown_codes, ids, texts, raw = task
+    digest = hashlib.blake2b(struct.pack('<II?', all_blocks, work_blocks, raw), digest_size=16)
+    digest.update(unknown_codes)
+    digest.update(ids)
+    # Cada texto vai prefixado pelo tamanho: um separador como '\0' deixaria
+    # listas diferentes (['a\0', 'b'] e ['a', '\0b']) com o mesmo hash
+    for text in texts:
+        data = text.encode('utf-8')
+        digest.update(len(data).to_bytes(4, 'little'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _load_text_tasks(tsv_file: str, dat_dir: str, log_callback=None):
+    """
+    Carrega as traduções do TSV e o mapeamento (.bmap ou .map) e monta as
+    tarefas de _write_text_dat, uma por .dat de texto
+    Os textos são decodificados em modo bruto se o TSV tiver o marcador .raw
+    Retorna None se o mapeamento não existir
+    """
+    raw = os.path.exists(raw_text_marker(tsv_file))
+    # Arquivo de mapeamento
+    map_file = tsv_file.replace('.tsv', '.map')
+    bmap_file = tsv_file.replace('.tsv', '.bmap')
+    
+    use_binary = os.path.exists(bmap_file) and (
+        not os.path.exists(map_file) or os.path.getmtime(bmap_file) >= os.path.getmtime(map_file)
+    )
+    
+    if not use_binary and not os.path.exists(map_file):
+        if log_callback:
+            log_callback(f"❌ Arquivo de mapeamento não encontrado: {map_file}")
+        return None
+    
+    # Carrega traduções do TSV (ID -> texto)
+    translations = load_tsv(tsv_file)
+    
+    if log_callback:
+        log_callback(f"📚 Carregadas {len(translations)} traduções")
+        if raw:
+            log_callback("🔒 Modo bruto: textos restaurados byte a byte (unescape_text)")
+    
+    if use_binary:
+        tasks = _binary_map_tasks(bmap_file, dat_dir, translations, raw)
+        if log_callback:
+            log_callback(f"📚 Carregado mapeamento binário para {len(tasks)} arquivos")
+    else:
+        tasks = _tsv_map_tasks(map_file, dat_dir, translations, raw)
+        if log_callback:
+            log_callback(f"📚 Carregado mapeamento para {len(tasks)} arquivos")
+    
+    return tasks
+
+
+def pack_texts_to_dat(tsv_file: str, dat_dir: str, log_callback=None, workers: int = 1,
+                      cache_dir: str = None) -> bool:
     """
     Empacota textos traduzidos de volta nos arquivos .dat
     Reconstrói os arquivos .dat do zero usando o mapeamento completo
+    
+    workers > 1 reconstrói os arquivos em paralelo (processos). Cada processo
+    recebe apenas as entradas do seu arquivo, já com o texto resolvido, então
+    o dicionário de traduções não é copiado para os processos
+    
+    Usa o .bmap (mapeamento binário) quando existir; o .map em TSV só é lido
+    se não houver .bmap ou se ele for mais novo (substituído à mão)
+    
+    cache_dir ativa o empacotamento incremental: o hash das entradas de cada
+    .dat fica em TEXT_PACK_MANIFEST e só os arquivos cujas entradas mudaram
+    desde o último empacotamento são reconstruídos
     """
     try:
-        # Arquivo de mapeamento
-        map_file = tsv_file.replace('.tsv', '.map')
+        tasks = _load_text_tasks(tsv_file, dat_dir, log_callback)
+        if tasks is None:
+            return False
         
-        if not os.path.exists(map_file):
+        manifest_file = os.path.join(cache_dir, TEXT_PACK_MANIFEST) if cache_dir else None
+        manifest = {}
+        skipped = 0
+        
+        if manifest_file:
+            if os.path.exists(manifest_file):
+                try:
+                    with open(manifest_file, 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+                except (OSError, ValueError):
+                    manifest = {}
+            
+            # Pula os .dat cujas entradas não mudaram (e que continuam com o
+            # tamanho gravado no último empacotamento)
+            digests = {}
+            pending = []
+            for task in tasks:
+                filename = os.path.basename(task[0])
+                digests[filename] = _text_task_digest(task)
+                known = manifest.get(filename)
+                if (known and known[0] == digests[filename] and os.path.exists(task[0])
+                        and os.path.getsize(task[0]) == known[1]):
+                    skipped += 1
+                    continue
+                pending.append(task)
+                manifest.pop(filename, None)
+            tasks = pending
+            
+            # Os arquivos a reconstruir saem do manifesto antes de serem
+            # gravados, assim uma falha no meio não deixa hashes desatualizados
+            with open(manifest_file, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+        
+        processed = 0
+        with (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as pool:
+            results = pool.map(_write_text_dat, tasks, chunksize=16) if pool else map(_write_text_dat, tasks)
+            for output_path in results:
+                processed += 1
+                if manifest_file:
+                    filename = os.path.basename(output_path)
+                    manifest[filename] = [digests[filename], os.path.getsize(output_path)]
+                if log_callback and processed % 50 == 0:
+                    log_callback(f"📦 Processados {processed} arquivos...")
+        
+        if manifest_file:
+            with open(manifest_file, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
             if log_callback:
-                log_callback(f"❌ Arquivo de mapeamento não encontrado: {map_file}")
+                log_callback(f"♻️ {skipped} arquivos de texto sem alterações, {processed} reconstruídos")
+        
+        if log_callback:
+            log_callback(f"✅ Empacotamento de textos completo: {processed} arquivos reconstruídos")
+        return True
+    
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro ao empacotar textos: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def pack_game_texts(tsv_file: str, dat_dir: str, output_file: str, log_callback=None,
+                    workers: int = 1, level: int = DEFAULT_COMPRESSION_LEVEL,
+                    cache_dir: str = None) -> bool:
+    """
+    Empacotamento direto .tsv → .bin, sem regravar os .dat de texto
+    Cada bloco de texto é reconstruído em memória (TSV + mapeamento), compactado
+    e gravado direto no container; os demais blocos são lidos dos .dat da sessão
+    Produz o mesmo .bin que pack_texts_to_dat + pack_game_file
+    
+    workers, level e cache_dir funcionam como em pack_game_file
+    Com cache_dir, o hash das entradas de cada bloco de texto fica em
+    TEXT_FRAME_MANIFEST junto com o hash do bloco montado: blocos cujas
+    entradas não mudaram vão direto do cache, sem serem reconstruídos
+    
+    Cada bloco do container original (BLOCK_MANIFEST ao lado do TSV ou na
+    pasta dos .dat) precisa vir de uma tarefa de texto ou de um .dat
+    """
+    try:
+        tasks = _load_text_tasks(tsv_file, dat_dir, log_callback)
+        if tasks is None:
             return False
         
-        # Carrega traduções do TSV (ID -> texto)
-        translations = {}
-        with open(tsv_file, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f, delimiter='\t')
-            next(reader, None)  # Pula header
-            for row in reader:
-                if len(row) >= 2:
-                    text_id = row[0]
-                    text = row[1]
-                    translations[text_id] = text
+        text_tasks = {os.path.basename(task[0]): task for task in tasks}
+        files = {f for f in os.listdir(dat_dir) if f.endswith('.dat') and _dat_number(f) is not None} | set(text_tasks)
+        files = sorted(files, key=_dat_number)
         
-        if log_callback:
-            log_callback(f"📚 Carregadas {len(translations)} traduções")
-        
-        # Carrega mapeamento e agrupa por arquivo
-        # Formato: File, AllBlocks, WorkBlocks, Block, Unknown, ID
-        file_data = {}  # filename -> lista de (block, unknown, id, text)
-        
-        with open(map_file, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f, delimiter='\t')
-            next(reader, None)  # Pula header
-            for row in reader:
-                if len(row) >= 6:
-                    filename = row[0]
-                    all_blocks = int(row[1])
-                    work_blocks = int(row[2])
-                    block = int(row[3])
-                    unknown = row[4]
-                    text_id = row[5]
-                    
-                    # Pega texto traduzido ou original
-                    text = translations.get(text_id, '')
-                    
-                    if filename not in file_data:
-                        file_data[filename] = {
-                            'all_blocks': all_blocks,
-                            'work_blocks': work_blocks,
-                            'entries': []
-                        }
-                    file_data[filename]['entries'].append({
-                        'block': block,
-                        'unknown': unknown,
-                        'id': text_id,
-                        'text': text
-                    })
+        if not files:
+            if log_callback:
+                log_callback("❌ Nenhum arquivo .dat encontrado na pasta")
+            return False
         
-        if log_callback:
-            log_callback(f"📚 Carregado mapeamento para {len(file_data)} arquivos")
+        block_count = _load_block_count(tsv_file.replace('.tsv', BLOCK_MANIFEST_EXT),
+                                        os.path.join(dat_dir, BLOCK_MANIFEST))
+        if not _check_blocks(files, block_count, log_callback):
+            return False
         
-        # Reconstrói cada arquivo .dat
-        processed = 0
-        for filename, data in file_data.items():
-            output_path = os.path.join(dat_dir, filename)
-            
-            all_blocks = data['all_blocks']
-            work_blocks = data['work_blocks']
-            entries = sorted(data['entries'], key=lambda x: x['block'])
-            
-            # Constrói o arquivo .dat do zero (igual ao script russo pak_text)
-            # Header: all_blocks(4) + 0(4) + work_blocks(4) + 0(4) + signature(4) + 0(4)
-            all_blocks_bytes = struct.pack('<II', all_blocks, 0)
-            work_blocks_bytes = struct.pack('<II', work_blocks, 0)
-            file_bytes = TEXT_BLOCK_SIGNATURE + b'\x00\x00\x00\x00'
+        manifest_file = os.path.join(cache_dir, TEXT_FRAME_MANIFEST) if cache_dir else None
+        manifest = {}
+        if manifest_file and os.path.exists(manifest_file):
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+        frames = {}
+        unchanged = set()
+        
+        with (BlockCache(cache_dir) if cache_dir else nullcontext()) as cache:
+            def compress_text(filename, task):
+                if cache is None:
+                    return _compress_block(b''.join(_text_dat_parts(task)), level)
+                
+                # Entradas iguais às do último empacotamento: o bloco montado
+                # também é igual e o frame dele já está no cache
+                digest = _text_task_digest(task)
+                known = manifest.get(filename)
+                if known and known[0] == digest:
+                    comp_data = cache.get(known[1])
+                    if comp_data is not None:
+                        frames[filename] = known
+                        unchanged.add(filename)
+                        return comp_data, known[2], True
+                
+                data = b''.join(_text_dat_parts(task))
+                key = cache.key(data)
+                frames[filename] = [digest, key, len(data)]
+                return _compress_block(data, level, cache, key)
             
-            # Bytes unknown (códigos)
-            filled_bytes_unk = b''
-            # Bytes ID + offset + length
-            filled_bytes_id = b''
-            # Bytes texto
-            filled_bytes_text = b''
+            def compress_one(filename):
+                task = text_tasks.get(filename)
+                if task is None:
+                    return _compress_dat(os.path.join(dat_dir, filename), level, cache)
+                return compress_text(filename, task)
             
-            # Calcula posições iniciais
-            start_unk = len(all_blocks_bytes) + len(work_blocks_bytes) + len(file_bytes)
-            start_id = start_unk + all_blocks + 17
-            curr_text = start_id + all_blocks * 16
+            compressed = _ordered_map(compress_one, files, workers)
+            reused = _write_game_file(output_file, compressed, len(files), log_callback)
             
-            for i, entry in enumerate(entries):
-                # Converte texto
-                text = entry['text'].replace('\\n', '\n').replace('\\r', '\r').encode('utf-8')
-                
-                # Unknown byte
-                unk_byte = bytes.fromhex(entry['unknown']) if entry['unknown'] else b'\x00'
-                filled_bytes_unk += unk_byte
-                
-                # ID bytes (8 bytes)
-                id_bytes = bytes.fromhex(entry['id'])
-                filled_bytes_id += id_bytes
+            if log_callback:
+                log_callback(f"📝 {len(text_tasks) - len(unchanged)} blocos de texto reconstruídos em memória"
+                             + (f" ({len(unchanged)} sem alterações)" if cache is not None else ""))
+            if cache is not None and log_callback:
+                log_callback(f"♻️ Reaproveitados {reused} blocos do cache, "
+                             f"{len(files) - reused} recompactados")
+        
+        if manifest_file:
+            with open(manifest_file, 'w', encoding='utf-8') as f:
+                json.dump(frames, f)
+        
+        if log_callback:
+            log_callback(f"✅ Empacotamento completo: {output_file}")
+        return True
+    
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro no empacotamento: {str(e)}")
+        return False
+
+
+def verify_game_file(input_file: str, log_callback=None, workers: int = 1, raw: bool = False) -> bool:
+    """
+    Verificação de ida e volta (extract_game_texts → pack_game_texts) em memória,
+    sem gravar nada em disco
+    
+    Cada bloco de texto passa pelo mesmo caminho do TSV (texto escapado,
+    traduções indexadas por ID) e é reconstruído como no empacotamento; o hash
+    do bloco reconstruído é comparado com o do original. Os demais blocos são
+    copiados sem alteração pelo empacotamento e não precisam ser comparados.
+    Só os blocos diferentes aparecem no log
+    
+    raw verifica o modo bruto (escape_text) em vez do TSV normal
+    Retorna True se todos os blocos de texto forem reproduzidos
+    """
+    try:
+        base_name = os.path.splitext(os.path.basename(input_file))[0]
+        
+        try:
+            reader = ContainerReader(input_file)
+        except ValueError as e:
+            if log_callback:
+                log_callback(f"❌ Arquivo inválido: {e}")
+            return False
+        
+        if log_callback:
+            log_callback(f"🔍 Verificando {len(reader)} blocos ({'modo bruto' if raw else 'TSV normal'})...")
+        
+        # Etapa 1 (extração): hash do bloco original e entradas como ficam no TSV/mapeamento
+        def read_one(i):
+            data = _extract_block(reader, i, text_only=True)
+            if data is None or not is_text_block(data):
+                return i, None
+            count_full, count_text, unknown_codes, entries = parse_text_block(data)
+            ids = b''.join(id_bytes for id_bytes, _ in entries)
+            texts = [_tsv_text(text_bytes, raw) for _, text_bytes in entries]
+            return i, (BlockCache.key(data), count_full, count_text, unknown_codes, ids, texts)
+        
+        text_blocks = {}
+        translations = {}
+        with reader:
+            # Mesma ordem do TSV: em IDs repetidos vale o último, como no empacotamento
+            indices = sorted(range(len(reader)), key=lambda i: f"{base_name}_{i}.dat")
+            for i, parsed in _ordered_map(read_one, indices, workers):
+                if parsed is None:
+                    continue
+                text_blocks[i] = parsed
+                ids_hex = parsed[4].hex()
+                for k, text in enumerate(parsed[5]):
+                    translations[ids_hex[k*16:(k+1)*16]] = text
+            block_count = len(reader)
+        
+        # Etapa 2 (empacotamento): reconstrói cada bloco a partir das traduções
+        def check_one(i):
+            digest, count_full, count_text, unknown_codes, ids, texts = text_blocks[i]
+            entries = MapFile(f"{base_name}_{i}.dat", count_full, count_text,
+                              list(range(len(texts))), unknown_codes, ids)
+            rebuilt = b''.join(_text_dat_parts(_map_task(entries, '', translations, raw)))
+            return i, BlockCache.key(rebuilt) == digest
+        
+        mismatches = [i for i, same in _ordered_map(check_one, sorted(text_blocks), workers) if not same]
+        
+        if log_callback:
+            for i in mismatches:
+                log_callback(f"❌ {base_name}_{i}.dat: bloco reconstruído diferente do original")
+            if mismatches:
+                log_callback(f"❌ {len(mismatches)} de {len(text_blocks)} blocos de texto diferentes")
+                if not raw:
+                    log_callback("💡 O modo bruto ([text] raw_mode) preserva bytes inválidos e barras invertidas")
+            else:
+                log_callback(f"✅ Ida e volta OK: {len(text_blocks)} blocos de texto reproduzidos "
+                             f"({block_count - len(text_blocks)} demais blocos copiados sem alteração)")
+        return not mismatches
+    
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro na verificação: {str(e)}")
+        return False
+
+
+# ============================================================================
+# EXTRAÇÃO E EMPACOTAMENTO EM LOTE (PASTA HD)
+# ============================================================================
+
+def _file_digest(path) -> str:
+    """Hash do conteúdo de um arquivo (lido em partes)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def batch_container_paths(session_path: Path, rel_path: str) -> tuple:
+    """
+    Caminhos de um container dentro de uma sessão em lote
+    Retorna: (dat_dir, tsv_file, bin_file), espelhando a estrutura da pasta HD
+    """
+    rel = Path(rel_path)
+    return (
+        session_path / "dat" / rel,
+        session_path / "tsv" / rel.parent / f"{rel.name}.tsv",
+        session_path / "bin" / rel,
+    )
+
+
+def extract_game_folder(hd_dir: str, session_path: Path, log_callback=None,
+                        workers: int = DEFAULT_WORKERS, raw: bool = False) -> bool:
+    """
+    Extrai todos os containers de TRANSLATION_STRUCTURE de uma pasta HD do jogo
+    em uma única sessão. Os containers são extraídos ao mesmo tempo, dividindo
+    um único pool de threads; containers idênticos byte a byte são extraídos
+    uma vez só e registrados no manifesto da sessão (batch.json)
+    raw funciona como em extract_texts_to_tsv
+    """
+    try:
+        hd_path = Path(hd_dir)
+        session_path = Path(session_path)
+        
+        containers = []
+        by_digest = {}
+        for folder, names in TRANSLATION_STRUCTURE.items():
+            for name in names:
+                rel_path = f"{folder}/{name}"
+                file_path = hd_path / rel_path
                 
-                # Offset e length (cada um 4 bytes)
-                # Offset é relativo à posição atual do ID (após os 8 bytes do ID)
-                current_id_pos = start_id + (i * 16) + 8
-                offset = curr_text - current_id_pos
-                filled_bytes_id += struct.pack('<II', offset, len(text))
+                if not file_path.is_file():
+                    if log_callback:
+                        log_callback(f"⚠️ Não encontrado: {rel_path}")
+                    continue
                 
-                # Texto
-                filled_bytes_text += text
-                curr_text += len(text)
+                primary = by_digest.setdefault(_file_digest(file_path), rel_path)
+                if primary == rel_path:
+                    containers.append({'path': rel_path, 'same_as': None})
+                else:
+                    containers.append({'path': rel_path, 'same_as': primary})
+                    if log_callback:
+                        log_callback(f"♻️ {rel_path} é idêntico a {primary} (extraído uma vez)")
+        
+        distinct = [c['path'] for c in containers if c['same_as'] is None]
+        if not distinct:
+            if log_callback:
+                log_callback(f"❌ Nenhum arquivo de tradução encontrado em: {hd_dir}")
+            return False
+        
+        # As extrações rodam em threads próprias; os logs voltam por uma fila
+        # e são repassados pela thread que chamou (a GUI não aceita logs de outras threads)
+        messages = queue.Queue()
+        
+        def drain_messages():
+            while not messages.empty():
+                message = messages.get()
+                if log_callback:
+                    log_callback(message)
+        
+        def extract_one(rel_path):
+            dat_dir, tsv_file, _ = batch_container_paths(session_path, rel_path)
+            dat_dir.mkdir(parents=True, exist_ok=True)
+            tsv_file.parent.mkdir(parents=True, exist_ok=True)
+            return extract_game_texts(
+                str(hd_path / rel_path), str(tsv_file),
+                log_callback=lambda message: messages.put(f"[{rel_path}] {message}"),
+                workers=workers, dat_dir=str(dat_dir), cache_dir=str(dat_dir), pool=block_pool, raw=raw
+            )
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as block_pool, \
+             ThreadPoolExecutor(max_workers=len(distinct)) as container_pool:
+            futures = [container_pool.submit(extract_one, rel_path) for rel_path in distinct]
+            while wait(futures, timeout=0.1).not_done:
+                drain_messages()
+            drain_messages()
+            results = [future.result() for future in futures]
+        
+        with open(session_path / BATCH_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump({'hd_path': str(hd_path), 'containers': containers}, f, indent=2)
+        
+        if log_callback:
+            log_callback(f"✅ Lote completo: {len(distinct)} containers extraídos "
+                         f"({len(containers) - len(distinct)} duplicados)")
+        return all(results)
+    
+    except Exception as e:
+        if log_callback:
+            log_callback(f"❌ Erro na extração em lote: {str(e)}")
+        return False
+
+
+def pack_game_folder(session_path: Path, log_callback=None, workers: int = DEFAULT_WORKERS,
+                     level: int = DEFAULT_COMPRESSION_LEVEL) -> bool:
+    """
+    Empacota uma sessão em lote (extract_game_folder)
+    Gera bin/ com a mesma estrutura da pasta HD; containers duplicados
+    recebem uma cópia do .bin do container principal
+    """
+    try:
+        session_path = Path(session_path)
+        with open(session_path / BATCH_MANIFEST, 'r', encoding='utf-8') as f:
+            containers = json.load(f)['containers']
+        
+        for entry in containers:
+            if entry['same_as']:
+                continue
             
-            # Adiciona padding após os unknown bytes (17 bytes extras)
-            # O formato original tem: unknown_codes + \xFF + primeiros 16 bytes dos unknown_codes (ou padding)
-            if len(filled_bytes_unk) >= 16:
-                padding = b'\xFF' + filled_bytes_unk[:16]
-            else:
-                padding = b'\xFF' + filled_bytes_unk + b'\x80' * (16 - len(filled_bytes_unk))
-            filled_bytes_unk += padding
+            rel_path = entry['path']
+            dat_dir, tsv_file, bin_file = batch_container_paths(session_path, rel_path)
+            bin_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Escreve arquivo completo
-            with open(output_path, 'wb') as f:
-                f.write(all_blocks_bytes)
-                f.write(work_blocks_bytes)
-                f.write(file_bytes)
-                f.write(filled_bytes_unk)
-                f.write(filled_bytes_id)
-                f.write(filled_bytes_text)
+            if log_callback:
+                log_callback(f"📦 {rel_path}")
+            if not pack_game_texts(str(tsv_file), str(dat_dir), str(bin_file), log_callback=log_callback,
+                                   workers=workers, level=level, cache_dir=str(dat_dir)):
+                return False
+        
+        for entry in containers:
+            if not entry['same_as']:
+                continue
             
-            processed += 1
-            if log_callback and processed % 50 == 0:
-                log_callback(f"📦 Processados {processed} arquivos...")
+            _, _, bin_file = batch_container_paths(session_path, entry['path'])
+            _, _, primary_bin = batch_container_paths(session_path, entry['same_as'])
+            bin_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(primary_bin, bin_file)
+            if log_callback:
+                log_callback(f"♻️ {entry['path']} copiado de {entry['same_as']}")
         
-        if log_callback:
-            log_callback(f"✅ Empacotamento de textos completo: {processed} arquivos reconstruídos")
         return True
     
     except Exception as e:
         if log_callback:
-            log_callback(f"❌ Erro ao empacotar textos: {str(e)}")
-        import traceback
-        traceback.print_exc()
+            log_callback(f"❌ Erro no empacotamento em lote: {str(e)}")
         return False
 
 
@@ -636,6 +1362,35 @@ class WWMTradutorGUI(QMainWindow):
         extract_btn.clicked.connect(self.run_full_extract)
         layout.addWidget(extract_btn)
         
+        verify_btn = QPushButton("🔍 Verificar Ida e Volta (sem gravar)")
+        verify_btn.setMinimumHeight(35)
+        verify_btn.clicked.connect(self.run_verify)
+        layout.addWidget(verify_btn)
+        
+        # Grupo: Extração em lote (pasta HD)
+        folder_group = QGroupBox("📁 Pasta HD do Jogo (todos os arquivos de tradução)")
+        folder_layout = QVBoxLayout(folder_group)
+        
+        folder_row = QHBoxLayout()
+        self.extract_folder_edit = QLineEdit()
+        self.extract_folder_edit.setPlaceholderText("Selecione a pasta HD do jogo (ex: Package/HD)...")
+        self.extract_folder_edit.setMinimumHeight(35)
+        folder_row.addWidget(self.extract_folder_edit)
+        
+        browse_folder_btn = QPushButton("📂 Procurar")
+        browse_folder_btn.setMinimumHeight(35)
+        browse_folder_btn.clicked.connect(self.browse_game_folder)
+        folder_row.addWidget(browse_folder_btn)
+        
+        folder_layout.addLayout(folder_row)
+        
+        extract_folder_btn = QPushButton("🚀 EXTRAIR PASTA HD")
+        extract_folder_btn.setMinimumHeight(35)
+        extract_folder_btn.clicked.connect(self.run_folder_extract)
+        folder_layout.addWidget(extract_folder_btn)
+        
+        layout.addWidget(folder_group)
+        
         layout.addStretch()
         return widget
     
@@ -733,6 +1488,12 @@ class WWMTradutorGUI(QMainWindow):
         if path:
             self.extract_file_edit.setText(path)
     
+    def browse_game_folder(self):
+        """Abre diálogo para selecionar a pasta HD do jogo"""
+        path = QFileDialog.getExistingDirectory(self, "Selecionar Pasta HD do Jogo")
+        if path:
+            self.extract_folder_edit.setText(path)
+    
     def open_output_folder(self):
         """Abre a pasta output no explorador"""
         output_path = get_output_folder()
@@ -747,11 +1508,11 @@ class WWMTradutorGUI(QMainWindow):
         for session in sessions:
             session_path = get_output_folder() / session
             
-            # Contar arquivos
-            dat_count = len(list((session_path / "dat").glob("*.dat"))) if (session_path / "dat").exists() else 0
-            tsv_count = len(list((session_path / "tsv").glob("*.tsv"))) if (session_path / "tsv").exists() else 0
+            # Contar arquivos (rglob também cobre sessões em lote)
+            dat_count = len(list((session_path / "dat").rglob("*.dat"))) if (session_path / "dat").exists() else 0
+            tsv_count = len(list((session_path / "tsv").rglob("*.tsv"))) if (session_path / "tsv").exists() else 0
             # Conta arquivos na pasta bin (sem extensão)
-            bin_count = len([f for f in (session_path / "bin").iterdir() if f.is_file()]) if (session_path / "bin").exists() else 0
+            bin_count = len([f for f in (session_path / "bin").rglob("*") if f.is_file()]) if (session_path / "bin").exists() else 0
             
             # Formatar data
             try:
@@ -777,11 +1538,11 @@ class WWMTradutorGUI(QMainWindow):
         self.current_session = session
         session_path = get_output_folder() / session
         
-        # Contar arquivos
-        dat_count = len(list((session_path / "dat").glob("*.dat"))) if (session_path / "dat").exists() else 0
-        tsv_files = list((session_path / "tsv").glob("*.tsv")) if (session_path / "tsv").exists() else []
+        # Contar arquivos (rglob também cobre sessões em lote)
+        dat_count = len(list((session_path / "dat").rglob("*.dat"))) if (session_path / "dat").exists() else 0
+        tsv_files = list((session_path / "tsv").rglob("*.tsv")) if (session_path / "tsv").exists() else []
         # Conta arquivos na pasta bin (sem extensão)
-        bin_count = len([f for f in (session_path / "bin").iterdir() if f.is_file()]) if (session_path / "bin").exists() else 0
+        bin_count = len([f for f in (session_path / "bin").rglob("*") if f.is_file()]) if (session_path / "bin").exists() else 0
         
         info = f"""
         <b>Sessão:</b> {session}<br>
@@ -836,21 +1597,14 @@ class WWMTradutorGUI(QMainWindow):
         # Desabilitar botões
         self.setEnabled(False)
         
-        # Etapa 1: Extrair bin → dat
-        self.log(f"📦 Etapa 1: Extraindo .bin para .dat...")
-        result1 = extract_game_file(input_file, str(dat_folder), log_callback=self.log)
+        # Extração direta bin → tsv (os .dat ainda são gravados para o empacotamento)
+        self.log(f"📦 Extraindo .bin para .tsv...")
+        result = extract_game_texts(input_file, str(tsv_file), log_callback=self.log,
+                                    workers=DEFAULT_WORKERS, dat_dir=str(dat_folder),
+                                    cache_dir=str(session_path),
+                                    raw=self.config.getboolean('text', 'raw_mode', fallback=False))
         
-        if not result1:
-            self.log("❌ Falha na extração dos arquivos .dat")
-            self.setEnabled(True)
-            self.statusBar().showMessage("Falhou!")
-            return
-        
-        # Etapa 2: Extrair dat → tsv
-        self.log(f"📝 Etapa 2: Extraindo textos para .tsv...")
-        result2 = extract_texts_to_tsv(str(dat_folder), str(tsv_file), log_callback=self.log)
-        
-        if not result2:
+        if not result:
             self.log("❌ Falha na extração dos textos")
             self.setEnabled(True)
             self.statusBar().showMessage("Falhou!")
@@ -876,6 +1630,79 @@ class WWMTradutorGUI(QMainWindow):
         if reply == QMessageBox.Yes:
             os.startfile(str(session_path))
     
+    def run_verify(self):
+        """Confere em memória se extrair e empacotar reproduz o arquivo selecionado"""
+        input_file = self.extract_file_edit.text()
+        
+        if not input_file or not os.path.exists(input_file):
+            QMessageBox.warning(self, "Aviso", "Selecione o arquivo .bin do jogo!")
+            return
+        
+        self.log(f"🔍 Verificação de ida e volta: {input_file}")
+        self.statusBar().showMessage("Verificando...")
+        self.setEnabled(False)
+        
+        result = verify_game_file(input_file, log_callback=self.log, workers=DEFAULT_WORKERS,
+                                  raw=self.config.getboolean('text', 'raw_mode', fallback=False))
+        
+        self.setEnabled(True)
+        self.statusBar().showMessage("Verificação OK!" if result else "Verificação encontrou diferenças!")
+    
+    def run_folder_extract(self):
+        """Executa extração em lote de todos os containers da pasta HD"""
+        hd_dir = self.extract_folder_edit.text()
+        
+        if not hd_dir or not os.path.isdir(hd_dir):
+            QMessageBox.warning(self, "Aviso", "Selecione a pasta HD do jogo!")
+            return
+        
+        session_path = create_session_folder()
+        
+        self.log(f"🚀 Iniciando extração em lote...")
+        self.log(f"📁 Sessão criada: {session_path.name}")
+        self.log(f"📂 Pasta HD: {hd_dir}")
+        self.statusBar().showMessage("Extraindo...")
+        self.setEnabled(False)
+        
+        result = extract_game_folder(hd_dir, session_path, log_callback=self.log,
+                                     workers=DEFAULT_WORKERS,
+                                     raw=self.config.getboolean('text', 'raw_mode', fallback=False))
+        
+        self.setEnabled(True)
+        self.refresh_session_list()
+        
+        if not result:
+            self.log("❌ Falha na extração em lote")
+            self.statusBar().showMessage("Falhou!")
+            return
+        
+        self.log(f"✅ Extração em lote completa!")
+        self.log(f"📁 Pasta: {session_path}")
+        self.statusBar().showMessage("Extração concluída!")
+    
+    def run_folder_pack(self, session_path: Path):
+        """Executa empacotamento de uma sessão em lote: tsv → dat → bin (estrutura HD)"""
+        self.log(f"🚀 Iniciando empacotamento em lote...")
+        self.log(f"📁 Sessão: {self.current_session}")
+        self.statusBar().showMessage("Empacotando...")
+        self.setEnabled(False)
+        
+        level = self.config.getint('pack', 'compression_level', fallback=DEFAULT_COMPRESSION_LEVEL)
+        result = pack_game_folder(session_path, log_callback=self.log,
+                                  workers=DEFAULT_WORKERS, level=level)
+        
+        self.setEnabled(True)
+        self.refresh_session_list()
+        
+        if not result:
+            self.log("❌ Falha no empacotamento em lote")
+            self.statusBar().showMessage("Falhou!")
+            return
+        
+        self.log(f"✅ Empacotamento em lote completo!")
+        self.log(f"📦 Arquivos para o jogo (estrutura da pasta HD): {session_path / 'bin'}")
+        self.statusBar().showMessage("Empacotamento concluído!")
+    
     def run_full_pack(self):
         """Executa empacotamento completo: tsv → dat → bin"""
         if not self.current_session:
@@ -883,6 +1710,10 @@ class WWMTradutorGUI(QMainWindow):
             return
         
         session_path = get_output_folder() / self.current_session
+        
+        if (session_path / BATCH_MANIFEST).exists():
+            self.run_folder_pack(session_path)
+            return
         dat_folder = session_path / "dat"
         tsv_folder = session_path / "tsv"
         bin_folder = session_path / "bin"
@@ -907,21 +1738,14 @@ class WWMTradutorGUI(QMainWindow):
         # Desabilitar botões
         self.setEnabled(False)
         
-        # Etapa 1: Aplicar traduções do TSV nos DAT
-        self.log(f"📝 Etapa 1: Aplicando traduções nos .dat...")
-        result1 = pack_texts_to_dat(str(tsv_file), str(dat_folder), log_callback=self.log)
-        
-        if not result1:
-            self.log("❌ Falha ao aplicar traduções")
-            self.setEnabled(True)
-            self.statusBar().showMessage("Falhou!")
-            return
-        
-        # Etapa 2: Empacotar dat → bin
-        self.log(f"📦 Etapa 2: Empacotando .dat para .bin...")
-        result2 = pack_game_file(str(dat_folder), str(output_bin), log_callback=self.log)
+        # Traduções do TSV aplicadas em memória e compactadas direto no .bin
+        # (os .dat de texto da sessão não são regravados)
+        self.log(f"📦 Aplicando traduções e empacotando para .bin...")
+        level = self.config.getint('pack', 'compression_level', fallback=DEFAULT_COMPRESSION_LEVEL)
+        result = pack_game_texts(str(tsv_file), str(dat_folder), str(output_bin), log_callback=self.log,
+                                 workers=DEFAULT_WORKERS, level=level, cache_dir=str(session_path))
         
-        if not result2:
+        if not result:
             self.log("❌ Falha no empacotamento")
             self.setEnabled(True)
             self.statusBar().showMessage("Falhou!")
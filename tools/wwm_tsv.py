@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWM TSV - Leitura dos arquivos ID<tab>Texto
+Leitor compartilhado entre o tradutor, o merge e a memória de tradução
+
+Autor: rodrigomiquilino
+Projeto: https://github.com/rodrigomiquilino/wwm_brasileiro
+Licença: MIT
+
+O TSV é lido em bytes, em blocos de CHUNK_SIZE, com o mesmo resultado do
+csv.reader(delimiter='\\t') que as ferramentas sempre usaram:
+    - bloco em que toda linha tem o mesmo número de tabs: o texto é dividido
+      de uma vez só (split) e só os campos que começam com aspas são
+      interpretados
+    - qualquer outro bloco (linhas vazias, campos entre aspas com tab ou
+      quebra de linha, colunas a mais ou a menos): linha a linha, com o
+      csv.reader só nos registros com aspas
+Com cache=True (opcional), load_tsv_columns guarda as colunas em um
+snapshot (.snap) e só interpreta o TSV de novo quando ele muda.
+"""
+
+import os
+import re
+import csv
+import time
+import struct
+import marshal
+import hashlib
+import operator
+from itertools import chain, compress, count, repeat
+
+# Tamanho dos blocos lidos do disco (leitura e hash do TSV)
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# \r que não faz parte de um \r\n
+_LONE_CR = re.compile(rb'\r(?!\n)')
+
+# Tudo menos tab e \n: translate(None, _NOT_SHAPE) deixa só a "forma" do bloco
+_NOT_SHAPE = bytes(b for b in range(256) if b not in b'\t\n')
+
+
+def _normalize_newlines(data: bytes) -> bytes:
+    """Converte as quebras de linha \\r\\n e \\r em \\n"""
+    if b'\r' not in data:
+        return data
+    if not _LONE_CR.search(data):
+        # Só \r\n: tirar os \r é bem mais barato que substituir \r\n
+        return data.replace(b'\r', b'')
+    return data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+
+# ============================================================================
+# BLOCOS UNIFORMES (mesmo número de tabs em todas as linhas)
+# ============================================================================
+
+def _unquote(field: str):
+    """
+    Valor de um campo que começa com aspas, como o csv.reader lê: "" vira ",
+    e o que vem depois das aspas de fechamento entra como está
+    Retorna None se as aspas não fecham no campo (tab ou quebra de linha
+    entre aspas)
+    """
+    value = []
+    pos = 1
+    while True:
+        end = field.find('"', pos)
+        if end < 0:
+            return None
+        if field[end + 1:end + 2] == '"':
+            value.append(field[pos:end + 1])
+            pos = end + 2
+            continue
+        value.append(field[pos:end])
+        value.append(field[end + 1:])
+        return ''.join(value)
+
+
+def _unquote_all(fields: list):
+    """
+    Tira as aspas de todos os campos de uma vez, quando todos são "..."
+    simples (como o csv.writer grava); None se algum não for
+    """
+    joined = '\n'.join(fields)
+    if len(joined) < 2 or joined[-1] != '"':
+        return None
+    inner = joined[1:-1].split('"\n"')
+    if len(inner) != len(fields):
+        return None
+    body = '\n'.join(inner)
+    if '"' in body:
+        if '"' in body.replace('""', ''):
+            return None
+        body = body.replace('""', '"')
+    return body.split('\n')
+
+
+def _unquote_parts(parts: list, quoted: list, stride: int) -> bool:
+    """
+    Interpreta em parts (campos do bloco, stride por linha) os campos
+    quoted, que começam com aspas. Linha com aspas que não fecham no campo
+    vai inteira para o csv.reader
+    Retorna False se alguma linha for um registro de várias linhas
+    """
+    values = _unquote_all([parts[i] for i in quoted])
+    if values is None:
+        values = [_unquote(parts[i]) for i in quoted]
+
+    rows = {}
+    for i, value in zip(quoted, values):
+        line = i // stride
+        if value is None and line not in rows:
+            start = line * stride
+            reader = csv.reader(('\t'.join(parts[start:start + stride]) + '\n', ''), delimiter='\t')
+            row = next(reader)
+            if reader.line_num > 1:
+                return False
+            rows[line] = row
+
+    for i, value in zip(quoted, values):
+        parts[i] = value
+    for line, row in rows.items():
+        start = line * stride
+        parts[start] = row[0]
+        parts[start + 1] = row[1] if len(row) > 1 else None
+    return True
+
+
+def _starting_with_quote(fields: list, step: int = 1, offset: int = 0) -> list:
+    """Índices (i * step + offset) dos campos que começam com aspas"""
+    return [i * step + offset for i in compress(count(), map(str.startswith, fields, repeat('"')))]
+
+
+def _split_uniform(chunk: bytes, skip_first: bool):
+    """
+    Divide um bloco de linhas completas (só \\n) em colunas de uma vez, se
+    todas as linhas tiverem o mesmo número de tabs (ao menos um)
+
+    Retorna: (ids, texts), ou None se o bloco precisa ser lido linha a linha
+    """
+    if skip_first:
+        end = chunk.find(b'\n') + 1
+        if not end or chunk[:1] == b'"' or b'\t"' in chunk[:end]:
+            return None
+        chunk = chunk[end:]
+    if not chunk:
+        return [], []
+    if not chunk.endswith(b'\n'):
+        chunk += b'\n'
+
+    tabs = chunk.count(b'\t', 0, chunk.find(b'\n'))
+    if not tabs:
+        return None
+    stride = tabs + 1
+    shape = chunk.translate(None, _NOT_SHAPE)
+    if shape != (b'\t' * tabs + b'\n') * (len(shape) // stride):
+        return None
+
+    parts = chunk.decode('utf-8').replace('\n', '\t').split('\t')
+    parts.pop()
+    if b'"' not in chunk:
+        return parts[::stride], parts[1::stride]
+
+    if stride > 2:
+        quoted = _starting_with_quote(parts)
+    else:
+        ids, texts = parts[::2], parts[1::2]
+        quoted = []
+        if chunk[:1] == b'"' or b'\n"' in chunk:
+            quoted = _starting_with_quote(ids, 2)
+        quoted += _starting_with_quote(texts, 2, 1)
+        if not quoted:
+            return ids, texts
+        quoted.sort()
+    if quoted and not _unquote_parts(parts, quoted, stride):
+        return None
+    return parts[::stride], parts[1::stride]
+
+
+# ============================================================================
+# LINHA A LINHA (demais blocos)
+# ============================================================================
+
+def _add_rows(lines: list, ids: list, texts: list):
+    """Linhas sem aspas: split direto, como o csv.reader dividiria"""
+    for line in lines:
+        if line:
+            row = line.split('\t', 2)
+            ids.append(row[0])
+            texts.append(row[1] if len(row) > 1 else None)
+
+
+def _parse_lines(lines: list, ids: list, texts: list, last: bool, skip_first: bool, tail: bool) -> int:
+    """
+    Lê as linhas do bloco (sem a quebra de linha; tail: a última não tinha
+    quebra de linha no arquivo) para ids/texts. Registros com aspas vão para
+    o csv.reader e podem continuar nas linhas seguintes
+
+    Retorna: quantas linhas foram lidas; as que sobram são um registro que
+    continua no próximo bloco
+    """
+    total = len(lines)
+    # Aspas só contam no começo de um campo
+    quoted = [i for i in compress(count(), map(operator.contains, lines, repeat('"')))
+              if lines[i][:1] == '"' or '\t"' in lines[i]]
+
+    pos = 0
+    if skip_first and total and (not quoted or quoted[0] != 0):
+        pos = 1
+    for start in quoted:
+        if start < pos:
+            continue
+        _add_rows(lines[pos:start], ids, texts)
+
+        # O '' no fim indica, pelo line_num, um registro que não terminou no bloco
+        full = total - tail
+        reader = csv.reader(chain(map('{}\n'.format, map(lines.__getitem__, range(start, full))),
+                                  lines[full:], ('',)), delimiter='\t')
+        row = next(reader)
+        pos = start + reader.line_num
+        if pos > total:
+            if not last:
+                return start
+            pos = total
+        if row and not (skip_first and start == 0):
+            ids.append(row[0])
+            texts.append(row[1] if len(row) > 1 else None)
+
+    _add_rows(lines[pos:], ids, texts)
+    return total
+
+
+def iter_tsv_columns(filepath: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Lê um TSV ID<tab>Texto em blocos de chunk_size bytes, sem carregar o
+    arquivo inteiro, com o mesmo resultado do csv.reader(delimiter='\\t')
+    O cabeçalho (primeiro registro) e as linhas vazias são ignorados
+
+    Gera: (ids, texts) por bloco, listas paralelas com a 1ª e a 2ª coluna
+    (texts[i] é None em linhas só com ID, como len(row) == 1 no csv.reader)
+    """
+    with open(filepath, 'rb') as f:
+        rest = b''
+        header = True
+        while True:
+            data = f.read(chunk_size)
+            last = not data
+            data = rest + data
+            if last:
+                chunk, rest = data, b''
+            else:
+                # Só linhas completas; o resto vai para o próximo bloco
+                cut = data.rfind(b'\n') + 1
+                chunk, rest = data[:cut], data[cut:]
+
+            if chunk:
+                chunk = _normalize_newlines(chunk)
+                columns = _split_uniform(chunk, header)
+                if columns is None:
+                    lines = chunk.decode('utf-8').split('\n')
+                    tail = bool(lines[-1])
+                    if not tail:
+                        lines.pop()
+                    ids, texts = [], []
+                    done = _parse_lines(lines, ids, texts, last, header, tail)
+                    if done < len(lines):
+                        rest = ('\n'.join(lines[done:]) + '\n').encode('utf-8') + rest
+                    columns = (ids, texts)
+                    header = header and not done
+                else:
+                    header = False
+                if columns[0]:
+                    yield columns
+
+            if last:
+                return
+
+
+def _read_columns(filepath) -> tuple:
+    ids, texts = [], []
+    for chunk_ids, chunk_texts in iter_tsv_columns(filepath):
+        ids += chunk_ids
+        texts += chunk_texts
+    return ids, texts
+
+
+def load_tsv_columns(filepath: str, cache: bool = False, cache_dir: str = None) -> tuple:
+    """
+    Lê o TSV inteiro em colunas, como iter_tsv_columns
+    Com cache (opcional, desligado por padrão), reaproveita o snapshot do
+    arquivo em cache_dir (padrão: .wwm_cache ao lado do TSV) enquanto o TSV
+    não mudar
+
+    Retorna: (ids, texts)
+    """
+    if not cache:
+        return _read_columns(filepath)
+    return _cached(filepath, 'columns', _read_columns, cache_dir)
+
+
+def load_tsv(filepath: str) -> dict:
+    """
+    Carrega um TSV ID<tab>Texto em um dict {id: texto}
+    Linhas sem texto são ignoradas; em IDs repetidos vale o último
+    """
+    data = {}
+    for ids, texts in iter_tsv_columns(filepath):
+        if None in texts:
+            pairs = [(text_id, text) for text_id, text in zip(ids, texts) if text is not None]
+            data.update(pairs)
+        else:
+            data.update(zip(ids, texts))
+    return data
+
+
+# ============================================================================
+# CACHE DE SNAPSHOTS (.snap)
+# ============================================================================
+#
+# Só com cache=True (opcional: nada é gravado sem pedir), as colunas lidas de
+# um TSV (load_tsv_columns) ficam gravadas em um diretório de cache (padrão:
+# .wwm_cache ao lado do TSV) e são reaproveitadas enquanto o TSV não mudar:
+#
+#     assinatura(4) + versão(4) + versão do marshal(4) + tamanho_caminho(4)
+#     + tamanho do TSV(8) + mtime_ns do TSV(8) + blake2b do conteúdo(16)
+#     caminho absoluto do TSV (UTF-8) + dados (marshal)
+#
+# Com tamanho e mtime iguais o snapshot vale sem reler o TSV; se só o mtime
+# mudou (checkout, cópia), o conteúdo é conferido pelo hash. Ler um snapshot
+# atualiza o mtime dele, que serve de "último uso" para a remoção LRU.
+#
+# Todos os inteiros são little-endian.
+
+SNAPSHOT_SIGNATURE = b'WWMS'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<4sIIIQq16s')
+
+CACHE_DIR_NAME = '.wwm_cache'
+# Limites do diretório de cache (os snapshots menos usados saem primeiro)
+CACHE_MAX_SNAPSHOTS = 16
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# TSV alterado há menos que isso: o mtime não é confiável (pode mudar de novo
+# no mesmo tique do relógio) e o snapshot fica para ser conferido pelo hash
+RACY_MTIME_NS = 2 * 10**9
+
+
+def cache_dir_for(filepath) -> str:
+    """Diretório de cache padrão de um TSV: .wwm_cache ao lado dele"""
+    return os.path.join(os.path.dirname(os.path.abspath(filepath)), CACHE_DIR_NAME)
+
+
+def _snapshot_path(source: str, kind: str, cache_dir: str) -> str:
+    key = hashlib.blake2b(source.encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(cache_dir, f"{os.path.basename(source)}.{kind}.{key}.snap")
+
+
+def _file_digest(filepath) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        while True:
+            data = f.read(CHUNK_SIZE)
+            if not data:
+                return digest.digest()
+            digest.update(data)
+
+
+def _read_snapshot_header(f):
+    """(tamanho, mtime_ns, hash, caminho) do snapshot; None se não for um snapshot válido"""
+    header = f.read(SNAPSHOT_HEADER.size)
+    if len(header) != SNAPSHOT_HEADER.size:
+        return None
+    signature, version, marshal_version, path_size, size, mtime_ns, digest = SNAPSHOT_HEADER.unpack(header)
+    if (signature != SNAPSHOT_SIGNATURE or version != SNAPSHOT_VERSION
+            or marshal_version != marshal.version):
+        return None
+    return size, mtime_ns, digest, f.read(path_size).decode('utf-8', errors='replace')
+
+
+def _read_snapshot(snapshot: str, source: str, stat):
+    """Dados do snapshot se ele vale para o TSV no estado de stat; None se não"""
+    try:
+        with open(snapshot, 'rb') as f:
+            header = _read_snapshot_header(f)
+            if header is None:
+                return None
+            size, mtime_ns, digest, path = header
+            if path != source or size != stat.st_size:
+                return None
+            if mtime_ns != stat.st_mtime_ns and _file_digest(source) != digest:
+                return None
+            payload = marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+
+    try:
+        if mtime_ns != stat.st_mtime_ns:
+            # Mesmo conteúdo com outro mtime: guarda o novo para não conferir o hash de novo
+            with open(snapshot, 'r+b') as f:
+                f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_SIGNATURE, SNAPSHOT_VERSION, marshal.version,
+                                             len(path.encode('utf-8')), size, _trusted_mtime(stat), digest))
+        os.utime(snapshot)
+    except OSError:
+        pass
+    return payload
+
+
+def _trusted_mtime(stat) -> int:
+    """mtime_ns a gravar no snapshot (0 se for recente demais para confiar)"""
+    if time.time_ns() - stat.st_mtime_ns < RACY_MTIME_NS:
+        return 0
+    return stat.st_mtime_ns
+
+
+def _write_snapshot(snapshot: str, source: str, stat, payload):
+    os.makedirs(os.path.dirname(snapshot), exist_ok=True)
+    path = source.encode('utf-8')
+    temp_file = f"{snapshot}.{os.getpid()}.tmp"
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_SIGNATURE, SNAPSHOT_VERSION, marshal.version, len(path),
+                                         stat.st_size, _trusted_mtime(stat), _file_digest(source)))
+            f.write(path)
+            f.write(marshal.dumps(payload))
+        os.replace(temp_file, snapshot)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def _is_stale(snapshot: str) -> bool:
+    """Snapshot de um TSV que não existe mais ou mudou de tamanho"""
+    with open(snapshot, 'rb') as f:
+        header = _read_snapshot_header(f)
+    if header is None:
+        return True
+    size, _, _, path = header
+    try:
+        return os.path.getsize(path) != size
+    except OSError:
+        return True
+
+
+def evict_snapshots(cache_dir: str, keep: str = None) -> int:
+    """
+    Remove do diretório de cache os snapshots obsoletos (TSV removido ou
+    alterado) e os menos usados recentemente além de CACHE_MAX_SNAPSHOTS /
+    CACHE_MAX_BYTES; keep nunca é removido
+
+    Retorna: quantidade de snapshots removidos
+    """
+    snapshots = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.snap'):
+            path = os.path.join(cache_dir, name)
+            stat = os.stat(path)
+            snapshots.append((stat.st_mtime_ns, stat.st_size, path))
+    snapshots.sort(reverse=True)
+
+    removed = 0
+    kept = 0
+    total = 0
+    for _, size, path in snapshots:
+        if path != keep and (kept >= CACHE_MAX_SNAPSHOTS or total + size > CACHE_MAX_BYTES or _is_stale(path)):
+            os.remove(path)
+            removed += 1
+            continue
+        kept += 1
+        total += size
+    return removed
+
+
+def _cached(filepath, kind: str, parse, cache_dir: str = None):
+    """
+    Resultado de parse(filepath) pelo snapshot, se valer; senão lê o TSV e
+    grava o snapshot. Problemas no cache (diretório sem permissão, snapshot
+    corrompido) nunca impedem a leitura do TSV
+    """
+    source = os.path.abspath(filepath)
+    stat = os.stat(source)
+    if cache_dir is None:
+        cache_dir = cache_dir_for(source)
+    snapshot = _snapshot_path(source, kind, cache_dir)
+
+    payload = _read_snapshot(snapshot, source, stat)
+    if payload is not None:
+        return payload
+
+    payload = parse(source)
+    try:
+        current = os.stat(source)
+        # Só grava se o TSV não mudou durante a leitura
+        if (current.st_size, current.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            _write_snapshot(snapshot, source, stat, payload)
+            evict_snapshots(cache_dir, keep=snapshot)
+    except OSError:
+        pass
+    return payload